@@ -10,6 +10,12 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import atexit
+import bisect
+import copy
+import functools
+import glob
+import itertools
 import json
 import os
 import time
@@ -18,13 +24,25 @@ import shutil
 import shlex
 import sqlite3
 import random
+import re
+import sys
 import threading
-import uuid
+import urllib.parse
 import queue as queue_module
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
 from datetime import timedelta
-from typing import AsyncIterable, Callable, Dict, Iterable, List, Optional
+from typing import TYPE_CHECKING, AsyncIterable, Callable, Dict, Iterable, List, Optional
 
-from nostr_sdk import Client, EventBuilder, EventId, Filter, Keys, Kind, NostrSigner, PublicKey, RelayUrl, Tag, Timestamp
+# nostr_sdk is a compiled extension that is slow to load, so it is imported
+# inside the functions that use it; commands that never build events, parse
+# keys or talk to relays do not pay for it.
+if TYPE_CHECKING:
+    from nostr_sdk import Client, EventBuilder, Keys, PublicKey
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 def _now() -> int:
@@ -35,6 +53,7 @@ def _default_config_path() -> str:
     return _default_db_path()
 
 
+@functools.lru_cache(maxsize=1)
 def _default_db_path() -> str:
     return os.path.expanduser("~/.config/ncc_publish/ncc.sqlite")
 
@@ -73,6 +92,7 @@ def _default_ncc_content_path(identifier: str) -> str:
     return os.path.join(os.getcwd(), filename)
 
 
+@functools.lru_cache(maxsize=256)
 def _format_ncc_identifier(raw: str) -> str:
     value = raw.strip()
     if not value:
@@ -124,38 +144,121 @@ def _is_truthy_response(value: str) -> bool:
     return value.strip().lower() in {"y", "yes", "true", "1"}
 
 
+def _json_loads(raw: object) -> object:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _json_dumps(data: object, *, indent: bool = False) -> str:
+    # Only for values stored in sqlite; files on disk keep json's
+    # ensure_ascii output, which orjson cannot produce.
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0).decode("utf-8")
+    if indent:
+        return json.dumps(data, indent=2, ensure_ascii=True)
+    return json.dumps(data)
+
+
 def _load_json(path: str) -> dict:
     try:
-        with open(path, "r", encoding="utf-8") as handle:
-            return json.load(handle)
+        with open(path, "rb") as handle:
+            return _json_loads(handle.read())
     except FileNotFoundError:
         return {}
 
 
+def _json_has_float(value: object) -> bool:
+    if isinstance(value, float):
+        return True
+    if isinstance(value, dict):
+        return any(_json_has_float(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_json_has_float(item) for item in value)
+    return False
+
+
 def _write_json(path: str, data: dict) -> None:
     os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w", encoding="utf-8") as handle:
-        json.dump(data, handle, indent=2, ensure_ascii=True)
-        handle.write("\n")
+    encoded = None
+    if orjson is not None and not _json_has_float(data):
+        # For str/int/bool/None content orjson's indented output matches
+        # what json writes below, except where it emits raw non-ASCII (or
+        # DEL) that ensure_ascii would escape. Floats are formatted
+        # differently (1e16, NaN -> null), so those payloads skip orjson;
+        # ints beyond 64 bits and non-str keys raise TypeError.
+        try:
+            encoded = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            encoded = None
+        if encoded is not None and (not encoded.isascii() or b"\x7f" in encoded):
+            encoded = None
+    if encoded is None:
+        encoded = json.dumps(data, indent=2, ensure_ascii=True).encode("ascii") + b"\n"
+    with open(path, "wb") as handle:
+        handle.write(encoded)
 
 
 def _write_text_file(path: str, content: str) -> None:
+    data = content.encode("utf-8")
+    # Revising a draft rewrites its content file every time; leave the file
+    # alone when it already holds exactly these bytes.
+    try:
+        if os.path.getsize(path) == len(data):
+            with open(path, "rb") as handle:
+                if handle.read() == data:
+                    return
+    except OSError:
+        pass
     os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
-    with open(path, "w", encoding="utf-8") as handle:
-        handle.write(content)
+    with open(path, "wb") as handle:
+        handle.write(data)
 
 
 _QUEUE_LOCK = threading.Lock()
-_PUBLISH_LOCK = threading.Lock()
+_QUEUE_CV = threading.Condition(_QUEUE_LOCK)
+# Publishes are serialized per relay set; unrelated relay sets may publish
+# concurrently.
+_PUBLISH_LOCKS: Dict[frozenset, threading.Lock] = {}
+_PUBLISH_LOCKS_LOCK = threading.Lock()
 _QUEUE_WORKER_STARTED = False
+_QUEUE_PENDING = False
 _QUEUE_DB_PATHS: set[str] = set()
-_QUEUE_POLL_SECONDS = 5
+_QUEUE_IDLE_SECONDS = 30
 _QUEUE_MAX_ATTEMPTS = 5
+_QUEUE_BATCH_SIZE = 32
 _QUEUE_BASE_DELAY = 30
 _QUEUE_MAX_DELAY = 3600
 _QUEUE_JITTER = 0.2
+_QUEUE_RETRY_DELAYS = tuple(
+    min(_QUEUE_MAX_DELAY, _QUEUE_BASE_DELAY * 2**i)
+    for i in range((_QUEUE_MAX_DELAY // _QUEUE_BASE_DELAY).bit_length() + 1)
+)
+
+_ASYNC_LOCK = threading.Lock()
+_ASYNC_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_ASYNC_THREAD: Optional[threading.Thread] = None
+_ASYNC_TIMEOUT = 120
+_CLIENTS: Dict[tuple[frozenset, Optional[str]], Client] = {}
+_CLIENTS_LOCK: Optional[asyncio.Lock] = None
+
+_DB_LOCAL = threading.local()
+_DB_INIT_PATHS: set[str] = set()
+_DB_CONNECTIONS: List[sqlite3.Connection] = []
+_DB_WRITE_QUEUE: "queue_module.Queue[tuple[str, Callable[[sqlite3.Connection], object], Future]]" = queue_module.Queue()
+_DB_WRITE_BATCH_SIZE = 500
+_DB_WRITER_LOCK = threading.Lock()
+_DB_WRITER: Optional[threading.Thread] = None
+_DB_PRAGMAS = (
+    "pragma synchronous = normal",
+    "pragma temp_store = memory",
+    "pragma mmap_size = 268435456",
+    "pragma busy_timeout = 5000",
+    "pragma cache_size = -20000",
+)
 
 _CONFIG_KEY = "root"
+_CONFIG_CACHE: Dict[str, tuple[tuple, object, bool]] = {}
 
 _CONTENT_MAX_BYTES = {
     30050: 256 * 1024,  # NCC document
@@ -164,16 +267,43 @@ _CONTENT_MAX_BYTES = {
 }
 
 
-def _load_config_db(config_path: Optional[str]) -> dict:
-    conn = _db_connect(config_path)
+def _config_cache_stamp(db_path: str) -> tuple:
+    # WAL commits only touch the -wal file, so both files make up the stamp.
+    stamp = []
+    for path in (db_path, db_path + "-wal"):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            stamp.append(None)
+        else:
+            stamp.append((stat.st_mtime_ns, stat.st_size))
+    return tuple(stamp)
+
+
+def _config_cache_entry(db_path: str) -> tuple[tuple, dict, bool]:
+    # (stamp, parsed config, whether the config row exists); callers must not
+    # mutate the cached config.
+    stamp = _config_cache_stamp(db_path)
+    cached = _CONFIG_CACHE.get(db_path)
+    if cached is not None and cached[0] == stamp:
+        return cached
+    conn = _db_connect_path(db_path)
     row = conn.execute("select value from config where key = ?", (_CONFIG_KEY,)).fetchone()
-    conn.close()
-    if not row:
-        return {}
-    try:
-        return json.loads(row["value"])
-    except (json.JSONDecodeError, TypeError):
-        return {}
+    config = {}
+    if row:
+        try:
+            config = _json_loads(row["value"])
+        except (ValueError, TypeError):
+            config = {}
+        if not isinstance(config, dict):
+            config = {}
+    entry = (stamp, config, row is not None)
+    _CONFIG_CACHE[db_path] = entry
+    return entry
+
+
+def _load_config_db(config_path: Optional[str]) -> dict:
+    return copy.deepcopy(_config_cache_entry(_resolve_db_path(config_path))[1])
 
 
 def _load_config_or_default(config_path: Optional[str], default: Optional[dict] = None) -> dict:
@@ -184,24 +314,24 @@ def _load_config_or_default(config_path: Optional[str], default: Optional[dict]
 
 
 def _write_config_db(config_path: str, data: dict) -> None:
-    conn = _db_connect(config_path)
-    payload = json.dumps(data, indent=2, ensure_ascii=True)
-    conn.execute(
-        """
-        insert into config (key, value) values (?, ?)
-        on conflict(key) do update set value = excluded.value
-        """,
-        (_CONFIG_KEY, payload),
+    payload = _json_dumps(data, indent=True)
+    db_path = _resolve_db_path(config_path)
+    _db_write(
+        db_path,
+        lambda conn: conn.execute(
+            """
+            insert into config (key, value) values (?, ?)
+            on conflict(key) do update set value = excluded.value
+            """,
+            (_CONFIG_KEY, payload),
+        ),
     )
-    conn.commit()
-    conn.close()
+    _CONFIG_CACHE.pop(db_path, None)
 
 
 def _config_exists(config_path: str) -> bool:
-    conn = _db_connect(config_path)
-    row = conn.execute("select 1 from config where key = ? limit 1", (_CONFIG_KEY,)).fetchone()
-    conn.close()
-    return row is not None
+    # Shares the config cache, so the load that usually follows is a hit.
+    return _config_cache_entry(_resolve_db_path(config_path))[2]
 
 
 def _queue_db_path(config_path: Optional[str]) -> str:
@@ -214,55 +344,88 @@ def _register_queue_db_path(config_path: Optional[str]) -> None:
         _QUEUE_DB_PATHS.add(db_path)
 
 
+def _queue_notify() -> None:
+    global _QUEUE_PENDING
+    with _QUEUE_CV:
+        _QUEUE_PENDING = True
+        _QUEUE_CV.notify_all()
+
+
 def _compute_retry_delay(attempts: int) -> int:
-    base = min(_QUEUE_MAX_DELAY, _QUEUE_BASE_DELAY * (2 ** max(attempts - 1, 0)))
-    jitter = 1.0 + random.uniform(-_QUEUE_JITTER, _QUEUE_JITTER)
+    base = _QUEUE_RETRY_DELAYS[min(max(attempts - 1, 0), len(_QUEUE_RETRY_DELAYS) - 1)]
+    jitter = 1.0 + (random.random() * 2.0 - 1.0) * _QUEUE_JITTER
     return max(1, int(base * jitter))
 
 
-def _enqueue_publish_task(task: dict) -> None:
+def _queue_task_row(task: dict) -> tuple:
     now = _now()
-    task.setdefault("id", uuid.uuid4().hex)
     task.setdefault("created_at", now)
     task.setdefault("attempts", 0)
     task.setdefault("max_attempts", _QUEUE_MAX_ATTEMPTS)
     task.setdefault("next_attempt_at", now + _compute_retry_delay(task["attempts"] + 1))
-    config_path = task.get("config_path")
-    _register_queue_db_path(config_path)
-    db_path = _queue_db_path(config_path)
-    conn = _db_connect_path(db_path)
-    conn.execute(
-        """
-        insert into publish_queue (
-            task_id,
-            config_path,
-            task_type,
-            draft_id,
-            json_path,
-            payload,
-            relays,
-            attempts,
-            max_attempts,
-            next_attempt_at,
-            created_at
-        ) values (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-        (
-            task["id"],
-            config_path,
-            task.get("type"),
-            task.get("draft_id"),
-            task.get("json_path"),
-            json.dumps(task.get("payload")) if task.get("payload") is not None else None,
-            json.dumps(task.get("relays") or []),
-            int(task.get("attempts", 0)),
-            int(task.get("max_attempts", _QUEUE_MAX_ATTEMPTS)),
-            int(task.get("next_attempt_at")),
-            int(task.get("created_at")),
-        ),
+    return (
+        task.get("id"),
+        task.get("config_path"),
+        task.get("type"),
+        task.get("draft_id"),
+        task.get("json_path"),
+        _json_dumps(task.get("payload")) if task.get("payload") is not None else None,
+        _json_dumps(task.get("relays") or []),
+        int(task.get("attempts", 0)),
+        int(task.get("max_attempts", _QUEUE_MAX_ATTEMPTS)),
+        int(task.get("next_attempt_at")),
+        int(task.get("created_at")),
     )
-    conn.commit()
-    conn.close()
+
+
+def _queue_insert_rows(conn: sqlite3.Connection, rows: List[tuple]) -> List[int]:
+    # Without a caller-supplied id the task is named after its rowid. The
+    # table is AUTOINCREMENT, so a rowid (and with it a task id) is never
+    # handed out again after its task is deleted.
+    row_ids = []
+    for row in rows:
+        cur = conn.execute(
+            """
+            insert into publish_queue (
+                task_id,
+                config_path,
+                task_type,
+                draft_id,
+                json_path,
+                payload,
+                relays,
+                attempts,
+                max_attempts,
+                next_attempt_at,
+                created_at
+            ) values (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (row[0] or "",) + row[1:],
+        )
+        row_id = int(cur.lastrowid)
+        if row[0] is None:
+            conn.execute("update publish_queue set task_id = ? where id = ?", (str(row_id), row_id))
+        row_ids.append(row_id)
+    return row_ids
+
+
+def _enqueue_publish_tasks(tasks: List[dict]) -> None:
+    grouped: Dict[str, List[dict]] = {}
+    for task in tasks:
+        config_path = task.get("config_path")
+        _register_queue_db_path(config_path)
+        grouped.setdefault(_queue_db_path(config_path), []).append(task)
+    for db_path, group in grouped.items():
+        rows = [_queue_task_row(task) for task in group]
+        row_ids = _db_write(db_path, lambda conn, rows=rows: _queue_insert_rows(conn, rows))
+        for task, row_id in zip(group, row_ids):
+            task.setdefault("id", str(row_id))
+    if tasks:
+        _queue_notify()
+
+
+def _enqueue_publish_task(task: dict) -> None:
+    _enqueue_publish_tasks([task])
 
 
 def _queue_notice(output: Optional[Callable[[str], None]], message: str) -> None:
@@ -278,6 +441,21 @@ def _resolve_relays(relays: Optional[List[str]], config: dict) -> List[str]:
     return []
 
 
+@functools.lru_cache(maxsize=8)
+def _parse_keys(privkey: str) -> Keys:
+    from nostr_sdk import Keys
+    # Keyed on the secret itself, so a changed privkey is simply a new entry.
+    return Keys.parse(privkey)
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_pubkey(value: str) -> PublicKey:
+    from nostr_sdk import PublicKey
+    # Author and steward lists are re-validated on every create/revise; only
+    # successful parses are cached, so bad input still raises each time.
+    return PublicKey.parse(value)
+
+
 def _load_privkey_from_config(config_path: Optional[str]) -> Optional[str]:
     if not config_path:
         return None
@@ -287,44 +465,109 @@ def _load_privkey_from_config(config_path: Optional[str]) -> Optional[str]:
     return None
 
 
+def _get_or_create_loop() -> asyncio.AbstractEventLoop:
+    global _ASYNC_LOOP, _ASYNC_THREAD, _CLIENTS_LOCK
+    with _ASYNC_LOCK:
+        if _ASYNC_THREAD is None or not _ASYNC_THREAD.is_alive():
+            # A loop whose thread has died cannot run anything, and the
+            # clients connected on it are unusable with it.
+            _CLIENTS.clear()
+            _CLIENTS_LOCK = None
+            loop = asyncio.new_event_loop()
+            _ASYNC_THREAD = threading.Thread(target=loop.run_forever, daemon=True)
+            _ASYNC_THREAD.start()
+            _ASYNC_LOOP = loop
+        return _ASYNC_LOOP
+
+
 def _run_async(coro: "asyncio.Future") -> str:
-    try:
-        asyncio.get_running_loop()
-    except RuntimeError:
-        return asyncio.run(coro)
-    result_queue: queue_module.Queue = queue_module.Queue()
+    # Relay clients are bound to the loop they connected on, so all relay
+    # work runs on one long-lived loop and connections survive between calls.
+    loop = _get_or_create_loop()
+    thread = _ASYNC_THREAD
+    future = asyncio.run_coroutine_threadsafe(coro, loop)
+    deadline = time.monotonic() + _ASYNC_TIMEOUT
+    while True:
+        try:
+            return future.result(timeout=max(0.0, min(1.0, deadline - time.monotonic())))
+        except FutureTimeoutError:
+            # The loop thread only dies if something escaped run_forever;
+            # the next call starts a fresh loop.
+            if thread is not None and not thread.is_alive():
+                raise RuntimeError("Relay event loop stopped unexpectedly.")
+            if time.monotonic() >= deadline:
+                future.cancel()
+                raise
+
+
+def _client_key(relays: List[str], keys: Optional[Keys]) -> tuple[frozenset, Optional[str]]:
+    return frozenset(relays), keys.public_key().to_hex() if keys is not None else None
+
+
+async def _get_client(relays: List[str], keys: Optional[Keys] = None) -> Client:
+    global _CLIENTS_LOCK
+    from nostr_sdk import Client, NostrSigner, RelayUrl
+    if _CLIENTS_LOCK is None:
+        _CLIENTS_LOCK = asyncio.Lock()
+    cache_key = _client_key(relays, keys)
+    async with _CLIENTS_LOCK:
+        client = _CLIENTS.get(cache_key)
+        if client is None:
+            client = Client(NostrSigner.keys(keys)) if keys is not None else Client()
+            for relay in relays:
+                await client.add_relay(RelayUrl.parse(relay))
+            await client.connect()
+            _CLIENTS[cache_key] = client
+    return client
+
+
+async def _discard_client(relays: List[str], keys: Optional[Keys] = None) -> None:
+    client = _CLIENTS.pop(_client_key(relays, keys), None)
+    if client is not None:
+        try:
+            await client.disconnect()
+        except Exception:
+            pass
+
 
-    def _runner() -> None:
+async def _disconnect_clients() -> None:
+    clients = list(_CLIENTS.values())
+    _CLIENTS.clear()
+    for client in clients:
         try:
-            result = asyncio.run(coro)
-        except Exception as exc:
-            result_queue.put(exc)
-        else:
-            result_queue.put(result)
+            await client.disconnect()
+        except Exception:
+            pass
 
-    thread = threading.Thread(target=_runner, daemon=True)
-    thread.start()
-    result = result_queue.get()
-    if isinstance(result, Exception):
-        raise result
-    return result
+
+def _close_async_loop() -> None:
+    loop = _ASYNC_LOOP
+    if loop is None or not loop.is_running():
+        return
+    try:
+        asyncio.run_coroutine_threadsafe(_disconnect_clients(), loop).result(timeout=5)
+    except Exception:
+        pass
+    loop.call_soon_threadsafe(loop.stop)
+
+
+atexit.register(_close_async_loop)
 
 
 async def _verify_event_on_relays_async(event_id: str, relays: List[str]) -> bool:
+    from nostr_sdk import EventId, Filter
     if not relays:
-        raise SystemExit("At least one relay is required to verify.")
-    client = Client()
-    for relay in relays:
-        await client.add_relay(RelayUrl.parse(relay))
-    await client.connect()
+        raise ValueError("At least one relay is required to verify.")
+    client = await _get_client(relays)
     try:
         events = await client.fetch_events(
             Filter().ids([EventId.parse(event_id)]),
             timedelta(seconds=5),
         )
-        return events.len() > 0
-    finally:
-        await client.disconnect()
+    except Exception:
+        await _discard_client(relays)
+        raise
+    return events.len() > 0
 
 
 def _verify_event_on_relays(event_id: str, relays: List[str]) -> bool:
@@ -349,14 +592,16 @@ def _attempt_publish_draft(config_path: str, draft_id: int, *, relays: List[str]
     store = DraftStore(config_path)
     draft = store.get_draft(draft_id)
     if not draft:
-        raise SystemExit("Draft not found.")
+        raise ValueError("Draft not found.")
     tags = store.get_tags(draft["id"])
     payload = _payload_from_draft(draft["kind"], draft["d"], draft["title"], draft["content"], tags, _now())
     event_id = _attempt_publish_payload(payload, relays=relays, keys=keys)
     published_at = _now() if draft["kind"] == 30050 else None
-    tags = _add_or_replace_tag(tags, "eventid", event_id)
+    tag_map = _tags_to_map(tags)
+    tag_map.upsert_single("eventid", event_id)
     if published_at is not None:
-        tags = _add_or_replace_tag(tags, "published_at", str(published_at))
+        tag_map.upsert_single("published_at", str(published_at))
+    tags = tag_map.to_pairs()
     store.update_draft(
         draft_id=int(draft["id"]),
         title=draft["title"],
@@ -371,6 +616,15 @@ def _attempt_publish_draft(config_path: str, draft_id: int, *, relays: List[str]
     return event_id
 
 
+def _publish_lock(relays: List[str]) -> threading.Lock:
+    key = frozenset(relays)
+    with _PUBLISH_LOCKS_LOCK:
+        lock = _PUBLISH_LOCKS.get(key)
+        if lock is None:
+            lock = _PUBLISH_LOCKS[key] = threading.Lock()
+    return lock
+
+
 def _run_publish_task(task: dict) -> str:
     config_path = task.get("config_path")
     service = PublishService(config_path)
@@ -378,8 +632,14 @@ def _run_publish_task(task: dict) -> str:
     relays = service.resolve_relays(task.get("relays"), config)
     privkey = _load_privkey_from_config(config_path)
     if not privkey:
-        raise SystemExit("Missing privkey for queued publish.")
-    keys = Keys.parse(privkey)
+        raise ValueError("Missing privkey for queued publish.")
+    keys = _parse_keys(privkey)
+    with _publish_lock(relays):
+        return _publish_resolved_task(service, task, relays=relays, keys=keys)
+
+
+def _publish_resolved_task(service: PublishService, task: dict, *, relays: List[str], keys: Keys) -> str:
+    config_path = task.get("config_path")
     kind = task.get("type")
     if kind == "draft":
         event_id = service.publish_draft(int(task["draft_id"]), relays=relays, keys=keys)
@@ -420,7 +680,7 @@ def _run_publish_task(task: dict) -> str:
     if kind == "payload":
         payload = task.get("payload")
         if not isinstance(payload, dict):
-            raise SystemExit("Queued payload is invalid.")
+            raise ValueError("Queued payload is invalid.")
         event_id = service.publish_payload(payload, relays=relays, keys=keys)
         if payload.get("kind") == 30051:
             authoritative, previous, steward = _extract_succession_fields_from_tags(payload.get("tags", []))
@@ -436,7 +696,48 @@ def _run_publish_task(task: dict) -> str:
             except ValueError:
                 pass
         return event_id
-    raise SystemExit("Unknown queued publish type.")
+    raise ValueError("Unknown queued publish type.")
+
+
+def _publish_task_now(service: PublishService, task: dict, *, keys: Keys, output: Callable[[str], None]) -> None:
+    relays = task["relays"]
+    try:
+        with _publish_lock(relays):
+            event_id = _publish_resolved_task(service, task, relays=relays, keys=keys)
+    except Exception as exc:
+        output(f"Publish failed: {exc}")
+        return
+    output(f"Published event {event_id}.")
+
+
+def _submit_publish_task(
+    service: PublishService,
+    task: dict,
+    *,
+    privkey: str,
+    keys: Keys,
+    output: Callable[[str], None],
+    background: bool = False,
+) -> None:
+    if not task["relays"]:
+        output("Error: at least one relay is required.")
+        return
+    if privkey == _load_privkey_from_config(task["config_path"]):
+        service.enqueue_task(task)
+        output("Queued for publishing.")
+        return
+    # The queue worker signs with the config privkey, so a different key
+    # typed at the prompt is used for an immediate publish instead.
+    output("Publishing event...")
+    if background:
+        threading.Thread(
+            target=_publish_task_now,
+            args=(service, task),
+            kwargs={"keys": keys, "output": output},
+            daemon=True,
+        ).start()
+        return
+    _publish_task_now(service, task, keys=keys, output=output)
 
 
 def _queue_row_to_task(row: sqlite3.Row) -> dict:
@@ -448,8 +749,8 @@ def _queue_row_to_task(row: sqlite3.Row) -> dict:
         "config_path": row["config_path"],
         "draft_id": row["draft_id"],
         "json_path": row["json_path"],
-        "payload": json.loads(payload_raw) if payload_raw else None,
-        "relays": json.loads(relays_raw) if relays_raw else [],
+        "payload": _json_loads(payload_raw) if payload_raw else None,
+        "relays": _json_loads(relays_raw) if relays_raw else [],
         "attempts": row["attempts"],
         "max_attempts": row["max_attempts"],
         "next_attempt_at": row["next_attempt_at"],
@@ -460,66 +761,105 @@ def _queue_row_to_task(row: sqlite3.Row) -> dict:
 def _process_publish_queue_db(db_path: str, output: Optional[Callable[[str], None]] = None) -> bool:
     conn = _db_connect_path(db_path)
     now = _now()
-    row = conn.execute(
+    rows = conn.execute(
         """
-        select * from publish_queue
-        where next_attempt_at <= ?
-        order by next_attempt_at asc
-        limit 1
+        select
+            id,
+            task_id,
+            config_path,
+            task_type,
+            draft_id,
+            json_path,
+            payload,
+            relays,
+            attempts,
+            max_attempts,
+            next_attempt_at,
+            created_at
+        from publish_queue
+        where next_attempt_at <= ? and attempts < max_attempts
+        order by next_attempt_at asc, id asc
+        limit ?
         """,
-        (now,),
-    ).fetchone()
-    conn.close()
-    if not row:
+        (now, _QUEUE_BATCH_SIZE),
+    ).fetchall()
+    if not rows:
         return False
-    task = _queue_row_to_task(row)
-    try:
-        with _PUBLISH_LOCK:
+    done_ids: List[tuple] = []
+    retry_rows: List[tuple] = []
+    for row in rows:
+        task = _queue_row_to_task(row)
+        try:
             event_id = _run_publish_task(task)
-        _queue_notice(output, f"Queued publish succeeded (event {event_id}).")
-        conn = _db_connect_path(db_path)
-        conn.execute("delete from publish_queue where id = ?", (int(row["id"]),))
-        conn.commit()
-        conn.close()
-        return True
-    except Exception as exc:
-        attempts = int(task.get("attempts", 0)) + 1
-        max_attempts = int(task.get("max_attempts", _QUEUE_MAX_ATTEMPTS))
-        conn = _db_connect_path(db_path)
-        if attempts >= max_attempts:
-            conn.execute("delete from publish_queue where id = ?", (int(row["id"]),))
-            conn.commit()
-            conn.close()
-            _queue_notice(output, f"Queued publish failed permanently after {attempts} attempts: {exc}")
-        else:
-            delay = _compute_retry_delay(attempts + 1)
-            next_attempt_at = _now() + delay
-            conn.execute(
-                """
-                update publish_queue
-                set attempts = ?, next_attempt_at = ?, last_error = ?
-                where id = ?
-                """,
-                (attempts, next_attempt_at, str(exc), int(row["id"])),
-            )
-            conn.commit()
-            conn.close()
-            _queue_notice(output, f"Queued publish failed (attempt {attempts}/{max_attempts}): {exc}")
-        return True
+            done_ids.append((int(row["id"]),))
+            _queue_notice(output, f"Queued publish succeeded (event {event_id}).")
+        except Exception as exc:
+            attempts = int(task.get("attempts", 0)) + 1
+            max_attempts = int(task.get("max_attempts", _QUEUE_MAX_ATTEMPTS))
+            if attempts >= max_attempts:
+                done_ids.append((int(row["id"]),))
+                _queue_notice(output, f"Queued publish failed permanently after {attempts} attempts: {exc}")
+            else:
+                next_attempt_at = _now() + _compute_retry_delay(attempts + 1)
+                retry_rows.append((attempts, next_attempt_at, str(exc), int(row["id"])))
+                _queue_notice(output, f"Queued publish failed (attempt {attempts}/{max_attempts}): {exc}")
+
+    def _apply(conn: sqlite3.Connection) -> None:
+        conn.executemany("delete from publish_queue where id = ?", done_ids)
+        conn.executemany(
+            """
+            update publish_queue
+            set attempts = ?, next_attempt_at = ?, last_error = ?
+            where id = ?
+            """,
+            retry_rows,
+        )
+
+    _db_write(db_path, _apply)
+    return True
 
 
-def _process_publish_queue_once(output: Optional[Callable[[str], None]] = None) -> None:
+def _queue_db_paths() -> List[str]:
     with _QUEUE_LOCK:
-        db_paths = list(_QUEUE_DB_PATHS or {_default_db_path()})
-    for db_path in db_paths:
+        return list(_QUEUE_DB_PATHS or {_default_db_path()})
+
+
+def _process_publish_queue_once(output: Optional[Callable[[str], None]] = None) -> bool:
+    for db_path in _queue_db_paths():
         if _process_publish_queue_db(db_path, output):
-            break
+            return True
+    return False
+
+
+def _queue_next_attempt_at() -> Optional[int]:
+    next_attempt_at = None
+    for db_path in _queue_db_paths():
+        conn = _db_connect_path(db_path)
+        row = conn.execute(
+            "select min(next_attempt_at) as next_attempt_at from publish_queue where attempts < max_attempts"
+        ).fetchone()
+        if row and row["next_attempt_at"] is not None:
+            value = int(row["next_attempt_at"])
+            if next_attempt_at is None or value < next_attempt_at:
+                next_attempt_at = value
+    return next_attempt_at
 
 
 def _queue_worker_loop(output: Optional[Callable[[str], None]] = None) -> None:
+    global _QUEUE_PENDING
     while True:
-        _process_publish_queue_once(output)
-        time.sleep(_QUEUE_POLL_SECONDS)
+        if _process_publish_queue_once(output):
+            continue
+        # Tasks enqueued by other processes never notify us, so the wait is
+        # capped even when nothing is scheduled.
+        timeout = _QUEUE_IDLE_SECONDS
+        next_attempt_at = _queue_next_attempt_at()
+        if next_attempt_at is not None:
+            timeout = min(timeout, max(0, next_attempt_at - _now()))
+        with _QUEUE_CV:
+            if not _QUEUE_PENDING:
+                _QUEUE_CV.wait(timeout)
+            _QUEUE_PENDING = False
 
 
 def _start_publish_queue_worker(output: Optional[Callable[[str], None]] = None) -> None:
@@ -538,19 +878,149 @@ def _resolve_db_path(config_path: Optional[str]) -> str:
     return _default_db_path()
 
 
-def _db_connect(config_path: Optional[str]) -> sqlite3.Connection:
-    db_path = _resolve_db_path(config_path)
-    return _db_connect_path(db_path)
+def _db_connect_path(db_path: str) -> sqlite3.Connection:
+    # Returns this thread's read-only connection, kept open for the life of
+    # the process; callers must not close it. All writes go through
+    # _db_write so the single writer thread owns the database lock.
+    cache = getattr(_DB_LOCAL, "connections", None)
+    if cache is None:
+        cache = _DB_LOCAL.connections = {}
+    conn = cache.get(db_path)
+    if conn is not None:
+        return conn
+    with _QUEUE_LOCK:
+        needs_init = db_path not in _DB_INIT_PATHS
+    if needs_init:
+        _db_write(db_path, lambda conn: None)
+    uri = f"file:{urllib.parse.quote(os.path.abspath(db_path))}?mode=ro"
+    conn = sqlite3.connect(uri, uri=True, isolation_level=None, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    _db_configure(conn)
+    cache[db_path] = conn
+    with _QUEUE_LOCK:
+        _DB_CONNECTIONS.append(conn)
+    return conn
 
 
-def _db_connect_path(db_path: str) -> sqlite3.Connection:
+def _db_write(db_path: str, fn: Callable[[sqlite3.Connection], object]) -> object:
+    future: Future = Future()
+    _db_start_writer()
+    _DB_WRITE_QUEUE.put((db_path, fn, future))
+    return future.result()
+
+
+def _db_start_writer() -> None:
+    global _DB_WRITER
+    with _DB_WRITER_LOCK:
+        if _DB_WRITER is not None:
+            return
+        _DB_WRITER = threading.Thread(target=_db_writer_loop, daemon=True)
+        _DB_WRITER.start()
+
+
+def _db_writer_connect(db_path: str) -> sqlite3.Connection:
     os.makedirs(os.path.dirname(db_path), exist_ok=True)
-    conn = sqlite3.connect(db_path)
+    conn = sqlite3.connect(db_path, isolation_level=None, check_same_thread=False)
     conn.row_factory = sqlite3.Row
+    conn.execute("pragma journal_mode = wal")
+    _db_configure(conn)
     _db_init(conn)
+    with _QUEUE_LOCK:
+        _DB_INIT_PATHS.add(db_path)
+        _DB_CONNECTIONS.append(conn)
     return conn
 
 
+def _db_writer_loop() -> None:
+    connections: Dict[str, sqlite3.Connection] = {}
+    while True:
+        batch = [_DB_WRITE_QUEUE.get()]
+        while len(batch) < _DB_WRITE_BATCH_SIZE:
+            try:
+                batch.append(_DB_WRITE_QUEUE.get_nowait())
+            except queue_module.Empty:
+                break
+        by_path: Dict[str, list] = {}
+        for item in batch:
+            by_path.setdefault(item[0], []).append(item)
+        for db_path, items in by_path.items():
+            _db_write_batch(connections, db_path, items)
+
+
+def _db_write_batch(connections: Dict[str, sqlite3.Connection], db_path: str, items: list) -> None:
+    results = []
+    conn = connections.get(db_path)
+    try:
+        if conn is None:
+            conn = connections[db_path] = _db_writer_connect(db_path)
+        conn.execute("begin immediate")
+        for _, fn, future in items:
+            # Each write gets its own savepoint so one failure does not
+            # discard the rest of the batch.
+            conn.execute("savepoint write_item")
+            try:
+                result = fn(conn)
+            except Exception as exc:
+                conn.execute("rollback to write_item")
+                conn.execute("release write_item")
+                results.append((future, None, exc))
+            else:
+                conn.execute("release write_item")
+                results.append((future, result, None))
+        conn.execute("commit")
+    except Exception as exc:
+        if conn is not None and conn.in_transaction:
+            conn.execute("rollback")
+        for _, _, future in items:
+            future.set_exception(exc)
+        return
+    for future, result, exc in results:
+        if exc is not None:
+            future.set_exception(exc)
+        else:
+            future.set_result(result)
+
+
+def _db_close_all() -> None:
+    with _QUEUE_LOCK:
+        connections = list(_DB_CONNECTIONS)
+        _DB_CONNECTIONS.clear()
+    for conn in connections:
+        try:
+            conn.execute("pragma optimize")
+        except sqlite3.Error:
+            pass
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+
+atexit.register(_db_close_all)
+
+
+def _db_configure(conn: sqlite3.Connection) -> None:
+    for pragma in _DB_PRAGMAS:
+        conn.execute(pragma)
+
+
+_PUBLISH_QUEUE_SCHEMA = """(
+    id integer primary key autoincrement,
+    task_id text not null,
+    config_path text,
+    task_type text not null,
+    draft_id integer,
+    json_path text,
+    payload text,
+    relays text,
+    attempts integer not null,
+    max_attempts integer not null,
+    next_attempt_at integer not null,
+    created_at integer not null,
+    last_error text
+)"""
+
+
 def _db_init(conn: sqlite3.Connection) -> None:
     conn.execute(
         """
@@ -589,31 +1059,44 @@ def _db_init(conn: sqlite3.Connection) -> None:
     conn.execute("create index if not exists idx_drafts_kind_d on drafts(kind, d)")
     conn.execute("create index if not exists idx_drafts_updated on drafts(updated_at)")
     conn.execute("create index if not exists idx_tags_draft on tags(draft_id)")
+    _db_migrate_publish_queue(conn)
+    conn.execute(f"create table if not exists publish_queue {_PUBLISH_QUEUE_SCHEMA}")
+    conn.execute("create index if not exists idx_publish_queue_next on publish_queue(next_attempt_at)")
     conn.execute(
         """
-        create table if not exists publish_queue (
-            id integer primary key,
-            task_id text not null,
-            config_path text,
-            task_type text not null,
-            draft_id integer,
-            json_path text,
-            payload text,
-            relays text,
-            attempts integer not null,
-            max_attempts integer not null,
-            next_attempt_at integer not null,
-            created_at integer not null,
-            last_error text
-        )
+        create index if not exists idx_publish_queue_ready
+        on publish_queue(next_attempt_at, id)
+        where attempts < max_attempts
         """
     )
-    conn.execute("create index if not exists idx_publish_queue_next on publish_queue(next_attempt_at)")
     _db_ensure_columns(conn, "drafts", {"source": "text", "author_pubkey": "text"})
     conn.execute("update drafts set source = 'local' where source is null")
     conn.commit()
 
 
+def _db_migrate_publish_queue(conn: sqlite3.Connection) -> None:
+    # Older databases created publish_queue without AUTOINCREMENT, which
+    # lets sqlite reuse the rowid (and task id) of a deleted last task.
+    # Rebuild such a table once, keeping its rows and ids.
+    row = conn.execute("select sql from sqlite_master where type = 'table' and name = 'publish_queue'").fetchone()
+    if row is None or "autoincrement" in (row["sql"] or "").lower():
+        return
+    columns = (
+        "id, task_id, config_path, task_type, draft_id, json_path, payload, relays, "
+        "attempts, max_attempts, next_attempt_at, created_at, last_error"
+    )
+    conn.execute("begin immediate")
+    try:
+        conn.execute("alter table publish_queue rename to publish_queue_old")
+        conn.execute(f"create table publish_queue {_PUBLISH_QUEUE_SCHEMA}")
+        conn.execute(f"insert into publish_queue ({columns}) select {columns} from publish_queue_old")
+        conn.execute("drop table publish_queue_old")
+        conn.execute("commit")
+    except Exception:
+        conn.execute("rollback")
+        raise
+
+
 def _db_ensure_columns(conn: sqlite3.Connection, table: str, columns: Dict[str, str]) -> None:
     existing = {row["name"] for row in conn.execute(f"pragma table_info({table})").fetchall()}
     for name, col_type in columns.items():
@@ -645,7 +1128,6 @@ def _db_insert_draft(
     )
     draft_id = int(cur.lastrowid)
     _db_set_tags(conn, draft_id, tags)
-    conn.commit()
     return draft_id
 
 
@@ -688,22 +1170,37 @@ def _db_update_draft(
         values,
     )
     _db_set_tags(conn, draft_id, tags)
-    conn.commit()
 
 
 def _db_set_tags(conn: sqlite3.Connection, draft_id: int, tags: List[tuple[str, str]]) -> None:
-    conn.execute("delete from tags where draft_id = ?", (draft_id,))
-    if tags:
+    # Tag order is significant for repeated keys, so only the rows after the
+    # first difference are rewritten; an unchanged tag list costs one select.
+    existing = conn.execute(
+        "select rowid, key, value from tags where draft_id = ? order by rowid",
+        (draft_id,),
+    ).fetchall()
+    keep = 0
+    for row, (key, value) in zip(existing, tags):
+        if row["key"] != key or row["value"] != value:
+            break
+        keep += 1
+    if keep == len(existing) and keep == len(tags):
+        return
+    if keep < len(existing):
+        conn.execute(
+            "delete from tags where draft_id = ? and rowid >= ?",
+            (draft_id, existing[keep]["rowid"]),
+        )
+    if keep < len(tags):
         conn.executemany(
             "insert into tags (draft_id, key, value) values (?, ?, ?)",
-            [(draft_id, key, value) for key, value in tags],
+            [(draft_id, key, value) for key, value in tags[keep:]],
         )
 
 
 def _db_delete_draft(conn: sqlite3.Connection, draft_id: int) -> None:
     conn.execute("delete from tags where draft_id = ?", (draft_id,))
     conn.execute("delete from drafts where id = ?", (draft_id,))
-    conn.commit()
 
 
 def _db_delete_endorsements_for_author_and_event(
@@ -727,7 +1224,6 @@ def _db_delete_endorsements_for_author_and_event(
     for row in rows:
         conn.execute("delete from tags where draft_id = ?", (row["id"],))
         conn.execute("delete from drafts where id = ?", (row["id"],))
-    conn.commit()
 
 
 def _db_get_latest_draft(conn: sqlite3.Connection, kind: int, d: str) -> Optional[sqlite3.Row]:
@@ -743,6 +1239,33 @@ def _db_get_latest_draft(conn: sqlite3.Connection, kind: int, d: str) -> Optiona
     return cur.fetchone()
 
 
+def _db_get_latest_draft_with_tags(
+    conn: sqlite3.Connection, kind: int, d: str
+) -> tuple[Optional[sqlite3.Row], List[tuple[str, str]]]:
+    # One statement for the revise flows, which always need both. Each row
+    # repeats the draft columns; a draft without tags comes back as a single
+    # row with null tag columns.
+    rows = conn.execute(
+        """
+        with latest as (
+            select * from drafts
+            where kind = ? and d = ?
+            order by updated_at desc
+            limit 1
+        )
+        select latest.*, tags.key as tag_key, tags.value as tag_value
+        from latest
+        left join tags on tags.draft_id = latest.id
+        order by tags.rowid
+        """,
+        (kind, d),
+    ).fetchall()
+    if not rows:
+        return None, []
+    tags = [(row["tag_key"], row["tag_value"]) for row in rows if row["tag_key"] is not None]
+    return rows[0], tags
+
+
 def _db_get_latest_endorsement_by_author_and_event(
     conn: sqlite3.Connection,
     *,
@@ -771,13 +1294,26 @@ def _db_get_tags(conn: sqlite3.Connection, draft_id: int) -> List[tuple[str, str
     return [(row["key"], row["value"]) for row in cur.fetchall()]
 
 
-def _format_ts(value: Optional[int]) -> str:
-    if not value:
-        return "-"
-    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(int(value)))
+def _db_get_tags_by_draft(conn: sqlite3.Connection, kind: int) -> Dict[int, List[tuple[str, str]]]:
+    # One query for a whole listing instead of one tags lookup per draft.
+    cur = conn.execute(
+        """
+        select tags.draft_id, tags.key, tags.value
+        from drafts
+        join tags on tags.draft_id = drafts.id
+        where drafts.kind = ?
+        order by tags.draft_id, tags.rowid
+        """,
+        (kind,),
+    )
+    return {
+        draft_id: [(row["key"], row["value"]) for row in rows]
+        for draft_id, rows in itertools.groupby(cur.fetchall(), key=lambda row: row["draft_id"])
+    }
 
 
 def _is_valid_relay_url(url: str) -> bool:
+    from nostr_sdk import RelayUrl
     try:
         RelayUrl.parse(url)
     except Exception:
@@ -786,6 +1322,7 @@ def _is_valid_relay_url(url: str) -> bool:
 
 
 def _validate_event_id(value: Optional[str], *, label: str) -> str:
+    from nostr_sdk import EventId
     if not value:
         raise ValueError(f"{label} is required.")
     try:
@@ -802,15 +1339,15 @@ def _normalize_steward_tag(value: Optional[str]) -> Optional[str]:
     if not raw:
         return None
     if raw.startswith("npub:"):
-        PublicKey.parse(raw.split(":", 1)[1])
+        _parse_pubkey(raw.split(":", 1)[1])
         return raw
     if raw.startswith("pubkey:"):
-        PublicKey.parse(raw.split(":", 1)[1])
+        _parse_pubkey(raw.split(":", 1)[1])
         return raw
     if raw.startswith("npub"):
-        PublicKey.parse(raw)
+        _parse_pubkey(raw)
         return f"npub:{raw}"
-    PublicKey.parse(raw)
+    _parse_pubkey(raw)
     return f"pubkey:{raw}"
 
 
@@ -823,7 +1360,7 @@ def _format_unpublished_drafts(rows: List[sqlite3.Row]) -> List[str]:
     lines = []
     for row in rows:
         title = row["title"] or "-"
-        updated_at = _format_ts(row["updated_at"])
+        updated_at = row["updated_fmt"]
         status = row["status"] or "draft"
         lines.append(f"  #{row['id']} {row['d']} {title} | {status} | updated {updated_at}")
     return lines
@@ -833,8 +1370,8 @@ def _format_published_drafts(rows: List[sqlite3.Row]) -> List[str]:
     lines = []
     for row in rows:
         title = row["title"] or "-"
-        updated_at = _format_ts(row["updated_at"])
-        published_at = _format_ts(row["published_at"])
+        updated_at = row["updated_fmt"]
+        published_at = row["published_fmt"]
         event_id = row["event_id"] or "-"
         lines.append(
             f"  #{row['id']} {row['d']} {title} | published {published_at} | updated {updated_at} | event {event_id}"
@@ -852,7 +1389,7 @@ def _format_published_ncc_event_choices(rows: List[sqlite3.Row]) -> List[str]:
     lines = []
     for row in rows:
         title = row["title"] or "-"
-        published_at = _format_ts(row["published_at"])
+        published_at = row["published_fmt"]
         event_id = row["event_id"] or "-"
         lines.append(f"  {event_id} | {title} | published {published_at}")
     return lines
@@ -868,7 +1405,7 @@ def _published_ncc_event_completer(rows: List[sqlite3.Row]) -> Optional["_Comman
         if not event_id:
             continue
         title = row["title"] or "-"
-        published_at = _format_ts(row["published_at"])
+        published_at = row["published_fmt"]
         options.append(event_id)
         meta[event_id] = f"{row['d']} {title} | {published_at}"
     if not options:
@@ -908,32 +1445,29 @@ def _get_local_ncc_targets(config_path: str, pubkey_hex: Optional[str]) -> tuple
 def _endorsement_counts_by_event(config_path: str) -> Dict[str, int]:
     store = DraftStore(config_path)
     conn = store.connect()
-    try:
-        cur = conn.execute(
-            """
-            select tags.value as endorses_value, count(distinct drafts.author_pubkey) as count
-            from drafts
-            join tags on tags.draft_id = drafts.id
-            where drafts.kind = 30052
-              and drafts.author_pubkey is not null
-              and drafts.author_pubkey != ''
-              and tags.key = 'endorses'
-            group by tags.value
-            """
-        )
-        results: Dict[str, int] = {}
-        for row in cur.fetchall():
-            raw_value = row["endorses_value"] or ""
-            if raw_value.startswith("event:"):
-                event_id = raw_value.split(":", 1)[1]
-            else:
-                event_id = raw_value
-            if not event_id:
-                continue
-            results[event_id] = int(row["count"])
-        return results
-    finally:
-        conn.close()
+    cur = conn.execute(
+        """
+        select tags.value as endorses_value, count(distinct drafts.author_pubkey) as count
+        from drafts
+        join tags on tags.draft_id = drafts.id
+        where drafts.kind = 30052
+          and drafts.author_pubkey is not null
+          and drafts.author_pubkey != ''
+          and tags.key = 'endorses'
+        group by tags.value
+        """
+    )
+    results: Dict[str, int] = {}
+    for row in cur.fetchall():
+        raw_value = row["endorses_value"] or ""
+        if raw_value.startswith("event:"):
+            event_id = raw_value.split(":", 1)[1]
+        else:
+            event_id = raw_value
+        if not event_id:
+            continue
+        results[event_id] = int(row["count"])
+    return results
 
 
 def _classify_ncc_row(
@@ -1058,37 +1592,35 @@ def _store_remote_endorsement_payload(config_path: str, payload: dict) -> bool:
 
 
 async def _fetch_remote_ncc_events(relays: List[str], limit: int) -> List[dict]:
+    from nostr_sdk import Filter, Kind
     if not relays:
         return []
-    client = Client()
-    for relay in relays:
-        await client.add_relay(RelayUrl.parse(relay))
-    await client.connect()
+    client = await _get_client(relays)
     try:
         events = await client.fetch_events(
             Filter().kinds([Kind(30050)]).limit(limit),
             timedelta(seconds=5),
         )
-        return [_event_to_payload(event) for event in events.to_vec()]
-    finally:
-        await client.disconnect()
+    except Exception:
+        await _discard_client(relays)
+        raise
+    return [_event_to_payload(event) for event in events.to_vec()]
 
 
 async def _fetch_remote_endorsement_events(relays: List[str], limit: int) -> List[dict]:
+    from nostr_sdk import Filter, Kind
     if not relays:
         return []
-    client = Client()
-    for relay in relays:
-        await client.add_relay(RelayUrl.parse(relay))
-    await client.connect()
+    client = await _get_client(relays)
     try:
         events = await client.fetch_events(
             Filter().kinds([Kind(30052)]).limit(limit),
             timedelta(seconds=5),
         )
-        return [_event_to_payload(event) for event in events.to_vec()]
-    finally:
-        await client.disconnect()
+    except Exception:
+        await _discard_client(relays)
+        raise
+    return [_event_to_payload(event) for event in events.to_vec()]
 
 
 def _sync_remote_ncc_proposals(config_path: str) -> int:
@@ -1099,7 +1631,7 @@ def _sync_remote_ncc_proposals(config_path: str) -> int:
     pubkey_hex = None
     if privkey:
         try:
-            pubkey_hex = Keys.parse(privkey).public_key().to_hex()
+            pubkey_hex = _parse_keys(privkey).public_key().to_hex()
         except Exception:
             pubkey_hex = None
     identifiers, event_ids = _get_local_ncc_targets(config_path, pubkey_hex)
@@ -1134,7 +1666,7 @@ def _sync_remote_endorsements(config_path: str) -> int:
     pubkey_hex = None
     if privkey:
         try:
-            pubkey_hex = Keys.parse(privkey).public_key().to_hex()
+            pubkey_hex = _parse_keys(privkey).public_key().to_hex()
         except Exception:
             pubkey_hex = None
     identifiers, event_ids = _get_local_ncc_targets(config_path, pubkey_hex)
@@ -1188,9 +1720,9 @@ def _extract_succession_fields_from_tags(tags: List) -> tuple[Optional[str], Opt
         steward = _extract_tag_value(tags, "steward")
     else:
         tag_map = _tags_to_map(tags or [])
-        authoritative = tag_map.get("authoritative", [None])[0]
-        previous = tag_map.get("previous", [None])[0]
-        steward = tag_map.get("steward", [None])[0]
+        authoritative = tag_map.get_single("authoritative")
+        previous = tag_map.get_single("previous")
+        steward = tag_map.get_single("steward")
     return (
         _strip_event_prefix(authoritative),
         _strip_event_prefix(previous),
@@ -1214,10 +1746,10 @@ def _extract_endorsement_fields_from_tags(
         topics = _extract_tag_values(tags, "t")
     else:
         tag_map = _tags_to_map(tags or [])
-        endorses = tag_map.get("endorses", [None])[0]
+        endorses = tag_map.get_single("endorses")
         roles = list(tag_map.get("role", []))
-        implementation = tag_map.get("implementation", [None])[0]
-        note = tag_map.get("note", [None])[0]
+        implementation = tag_map.get_single("implementation")
+        note = tag_map.get_single("note")
         topics = list(tag_map.get("t", []))
     return (
         _strip_event_prefix(endorses),
@@ -1328,10 +1860,21 @@ def _check_succession_not_self(config_path: str, authoritative_event: str, keys:
     return not _is_author_self(authors, keys)
 
 
+# Listings show both timestamps for every row, so they are formatted by
+# sqlite in the query (local time, "-" when unset).
+_LIST_TS_COLUMNS = """
+            case when updated_at then strftime('%Y-%m-%d %H:%M:%S', updated_at, 'unixepoch', 'localtime')
+                else '-' end as updated_fmt,
+            case when published_at then strftime('%Y-%m-%d %H:%M:%S', published_at, 'unixepoch', 'localtime')
+                else '-' end as published_fmt
+""".strip()
+
+
 def _db_list_drafts(conn: sqlite3.Connection, kind: int) -> List[sqlite3.Row]:
     cur = conn.execute(
-        """
-        select id, d, title, status, updated_at, published_at, event_id, source, author_pubkey
+        f"""
+        select id, d, title, status, updated_at, published_at, event_id, source, author_pubkey,
+            {_LIST_TS_COLUMNS}
         from drafts
         where kind = ?
         order by updated_at desc
@@ -1343,8 +1886,9 @@ def _db_list_drafts(conn: sqlite3.Connection, kind: int) -> List[sqlite3.Row]:
 
 def _db_list_unpublished_drafts(conn: sqlite3.Connection, kind: int) -> List[sqlite3.Row]:
     cur = conn.execute(
-        """
-        select id, d, title, status, updated_at, published_at
+        f"""
+        select id, d, title, status, updated_at, published_at,
+            {_LIST_TS_COLUMNS}
         from drafts
         where kind = ? and (status is null or status != 'published') and (source is null or source = 'local')
         order by updated_at desc
@@ -1356,8 +1900,9 @@ def _db_list_unpublished_drafts(conn: sqlite3.Connection, kind: int) -> List[sql
 
 def _db_list_published_drafts(conn: sqlite3.Connection, kind: int) -> List[sqlite3.Row]:
     cur = conn.execute(
-        """
-        select id, d, title, status, updated_at, published_at, event_id
+        f"""
+        select id, d, title, status, updated_at, published_at, event_id,
+            {_LIST_TS_COLUMNS}
         from drafts
         where kind = ? and event_id is not null and event_id != '' and (source is null or source = 'local')
         order by updated_at desc
@@ -1389,45 +1934,38 @@ class DraftStore:
 
     def get_draft(self, draft_id: int) -> Optional[sqlite3.Row]:
         conn = self.connect()
-        try:
-            return conn.execute("select * from drafts where id = ?", (int(draft_id),)).fetchone()
-        finally:
-            conn.close()
+        return conn.execute("select * from drafts where id = ?", (int(draft_id),)).fetchone()
 
     def get_draft_by_event_id(self, kind: int, event_id: str) -> Optional[sqlite3.Row]:
         conn = self.connect()
-        try:
-            return conn.execute(
-                "select * from drafts where kind = ? and event_id = ?",
-                (kind, event_id),
-            ).fetchone()
-        finally:
-            conn.close()
+        return conn.execute(
+            "select * from drafts where kind = ? and event_id = ?",
+            (kind, event_id),
+        ).fetchone()
 
     def get_latest_draft(self, kind: int, d: str) -> Optional[sqlite3.Row]:
         conn = self.connect()
-        try:
-            return _db_get_latest_draft(conn, kind, d)
-        finally:
-            conn.close()
+        return _db_get_latest_draft(conn, kind, d)
+
+    def get_latest_draft_with_tags(self, kind: int, d: str) -> tuple[Optional[sqlite3.Row], List[tuple[str, str]]]:
+        conn = self.connect()
+        return _db_get_latest_draft_with_tags(conn, kind, d)
 
     def get_latest_endorsement_by_author_and_event(self, author_pubkey: str, endorses_event: str) -> Optional[sqlite3.Row]:
         conn = self.connect()
-        try:
-            return _db_get_latest_endorsement_by_author_and_event(
-                conn,
-                author_pubkey=author_pubkey,
-                endorses_event=endorses_event,
-            )
-        finally:
-            conn.close()
+        return _db_get_latest_endorsement_by_author_and_event(
+            conn,
+            author_pubkey=author_pubkey,
+            endorses_event=endorses_event,
+        )
 
     def get_tags(self, draft_id: int) -> List[tuple[str, str]]:
         conn = self.connect()
-        try:
-            return _db_get_tags(conn, draft_id)
-        finally:
-            conn.close()
+        return _db_get_tags(conn, draft_id)
+
+    def get_tags_by_draft(self, kind: int) -> Dict[int, List[tuple[str, str]]]:
+        conn = self.connect()
+        return _db_get_tags_by_draft(conn, kind)
 
     def insert_draft(
         self,
@@ -1443,9 +1981,9 @@ class DraftStore:
         source: str = "local",
         author_pubkey: Optional[str] = None,
     ) -> int:
-        conn = self.connect()
-        try:
-            return _db_insert_draft(
+        return _db_write(
+            self.db_path,
+            lambda conn: _db_insert_draft(
                 conn,
                 kind=kind,
                 d=d,
@@ -1457,9 +1995,8 @@ class DraftStore:
                 created_at=created_at,
                 source=source,
                 author_pubkey=author_pubkey,
-            )
-        finally:
-            conn.close()
+            ),
+        )
 
     def update_draft(
         self,
@@ -1474,9 +2011,9 @@ class DraftStore:
         source: Optional[str] = None,
         author_pubkey: Optional[str] = None,
     ) -> None:
-        conn = self.connect()
-        try:
-            _db_update_draft(
+        _db_write(
+            self.db_path,
+            lambda conn: _db_update_draft(
                 conn,
                 draft_id=draft_id,
                 title=title,
@@ -1487,48 +2024,33 @@ class DraftStore:
                 event_id=event_id,
                 source=source,
                 author_pubkey=author_pubkey,
-            )
-        finally:
-            conn.close()
+            ),
+        )
 
     def delete_draft(self, draft_id: int) -> None:
-        conn = self.connect()
-        try:
-            _db_delete_draft(conn, int(draft_id))
-        finally:
-            conn.close()
+        _db_write(self.db_path, lambda conn: _db_delete_draft(conn, int(draft_id)))
 
     def delete_endorsements_for_author_and_event(self, author_pubkey: str, endorses_event: str) -> None:
-        conn = self.connect()
-        try:
-            _db_delete_endorsements_for_author_and_event(
+        _db_write(
+            self.db_path,
+            lambda conn: _db_delete_endorsements_for_author_and_event(
                 conn,
                 author_pubkey=author_pubkey,
                 endorses_event=endorses_event,
-            )
-        finally:
-            conn.close()
+            ),
+        )
 
     def list_drafts(self, kind: int) -> List[sqlite3.Row]:
         conn = self.connect()
-        try:
-            return _db_list_drafts(conn, kind)
-        finally:
-            conn.close()
+        return _db_list_drafts(conn, kind)
 
     def list_unpublished_drafts(self, kind: int) -> List[sqlite3.Row]:
         conn = self.connect()
-        try:
-            return _db_list_unpublished_drafts(conn, kind)
-        finally:
-            conn.close()
+        return _db_list_unpublished_drafts(conn, kind)
 
     def list_published_drafts(self, kind: int) -> List[sqlite3.Row]:
         conn = self.connect()
-        try:
-            return _db_list_published_drafts(conn, kind)
-        finally:
-            conn.close()
+        return _db_list_published_drafts(conn, kind)
 
 
 class PublishService:
@@ -1556,40 +2078,66 @@ class PublishService:
 
     def enqueue_task(self, task: dict) -> None:
         _enqueue_publish_task(task)
-def _open_in_editor(path: str) -> None:
-    raw_editor = os.environ.get("EDITOR") or os.environ.get("VISUAL")
+
+
+@functools.lru_cache(maxsize=4)
+def _resolve_editor_cmd(raw_editor: Optional[str]) -> tuple[str, ...]:
     if raw_editor:
-        editor_cmd = shlex.split(raw_editor)
-    else:
-        editor_cmd = []
-        for candidate in ("nano", "vi"):
-            if shutil.which(candidate):
-                editor_cmd = [candidate]
-                break
+        return tuple(shlex.split(raw_editor))
+    for candidate in ("nano", "vi"):
+        if shutil.which(candidate):
+            return (candidate,)
+    return ()
+
+
+def _file_stamp(path: str) -> Optional[tuple[int, int, int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+def _open_in_editor(path: str) -> bool:
+    # Returns whether the file changed, so callers can keep the content they
+    # already hold when the editor exits without saving.
+    editor_cmd = list(_resolve_editor_cmd(os.environ.get("EDITOR") or os.environ.get("VISUAL")))
     if not editor_cmd:
         raise SystemExit("No editor found. Set $EDITOR or $VISUAL.")
+    before = _file_stamp(path)
+    sys.stdout.flush()
     try:
         subprocess.run(editor_cmd + [path], check=True)
     except FileNotFoundError as exc:
         raise SystemExit(f"Editor not found: {editor_cmd[0]}") from exc
+    return _file_stamp(path) != before
 
 
 class _CommandCompleter:
     def __init__(self, commands: List[str], meta: Optional[Dict[str, str]] = None) -> None:
         self._commands = commands
         self._meta = meta or {}
+        self._sorted = sorted((cmd, index) for index, cmd in enumerate(commands))
+        self._sorted_keys = [cmd for cmd, _ in self._sorted]
+
+    def _matching(self, token: str) -> List[str]:
+        if not token:
+            return list(self._commands)
+        lo = bisect.bisect_left(self._sorted_keys, token)
+        hi = bisect.bisect_left(self._sorted_keys, token + "\U0010ffff", lo)
+        # Completions keep the caller's ordering, not the sort order.
+        return [cmd for _, cmd in sorted((index, cmd) for cmd, index in self._sorted[lo:hi])]
 
     def get_completions(self, document, complete_event) -> Iterable[object]:
         from prompt_toolkit.completion import Completion
-        text = document.text_before_cursor
-        token = text.split()[-1] if text.split() else ""
-        for cmd in self._commands:
-            if cmd.startswith(token):
-                yield Completion(
-                    cmd,
-                    start_position=-len(token),
-                    display_meta=self._meta.get(cmd, ""),
-                )
+        parts = document.text_before_cursor.rsplit(None, 1)
+        token = parts[-1] if parts else ""
+        for cmd in self._matching(token):
+            yield Completion(
+                cmd,
+                start_position=-len(token),
+                display_meta=self._meta.get(cmd, ""),
+            )
 
     async def get_completions_async(self, document, complete_event) -> AsyncIterable[object]:
         for completion in self.get_completions(document, complete_event):
@@ -1597,6 +2145,13 @@ class _CommandCompleter:
 
 
 def _build_command_prompt(commands: List[str], meta: Optional[Dict[str, str]] = None) -> Callable[[], str]:
+    if not sys.stdin.isatty():
+        # Scripted input: skip prompt_toolkit/readline and treat EOF as /quit.
+        def _piped() -> str:
+            line = sys.stdin.readline()
+            return line.strip() if line else "/quit"
+        return _piped
+
     try:
         from prompt_toolkit import prompt
         from prompt_toolkit.shortcuts import CompleteStyle
@@ -1621,6 +2176,16 @@ def _build_command_prompt(commands: List[str], meta: Optional[Dict[str, str]] =
     return _with_completion
 
 
+def _prompt_export_path() -> Optional[str]:
+    # Last prompt of the create-* subcommands; scripted runs that stop
+    # feeding answers before it simply skip the export.
+    try:
+        return input("Export JSON path (optional): ").strip() or None
+    except EOFError:
+        print()
+        return None
+
+
 def _prompt_value(label: str, default: Optional[str] = None, required: bool = False) -> str:
     while True:
         prompt = label
@@ -1645,8 +2210,20 @@ def _prompt_list(label: str, default: Optional[List[str]] = None) -> List[str]:
 
 
 def _load_content_from_path(path: str) -> str:
-    with open(path, "r", encoding="utf-8") as handle:
-        return handle.read()
+    # Flows re-read the same content file after each editor session and on
+    # publish; the stat key picks up any write, including editors that save
+    # by replacing the file.
+    stat = os.stat(path)
+    return _read_content_cached(os.path.abspath(path), stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=32)
+def _read_content_cached(path: str, inode: int, mtime_ns: int, size: int) -> str:
+    with open(path, "rb") as handle:
+        content = handle.read().decode("utf-8")
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
 
 
 def _normalize_list(value: Optional[object]) -> List[str]:
@@ -1665,8 +2242,18 @@ def _normalize_list(value: Optional[object]) -> List[str]:
     return [value_str] if value_str else []
 
 
+_LIST_SPLIT_RE = re.compile(r"\s*,\s*")
+
+
+@functools.lru_cache(maxsize=256)
+def _split_list_cached(raw: str) -> tuple:
+    return tuple(filter(None, _LIST_SPLIT_RE.split(raw.strip())))
+
+
 def _parse_list_value(raw: str) -> List[str]:
-    return _normalize_list(raw)
+    if not isinstance(raw, str):
+        return _normalize_list(raw)
+    return list(_split_list_cached(raw))
 
 
 def _validate_author_keys(authors: Optional[List[str]]) -> List[str]:
@@ -1681,7 +2268,7 @@ def _validate_author_keys(authors: Optional[List[str]]) -> List[str]:
             errors.append(f"{value} looks like a secret key (nsec)")
             continue
         try:
-            PublicKey.parse(value)
+            _parse_pubkey(value)
         except Exception:
             errors.append(f"{value} is not a valid npub or hex public key")
     if errors:
@@ -1703,7 +2290,7 @@ def _extract_tag_values(tags: List[List[str]], key: str) -> List[str]:
 def _strip_event_prefix(value: Optional[str]) -> Optional[str]:
     if not value:
         return None
-    return value.replace("event:", "", 1) if value.startswith("event:") else value
+    return value[6:] if value.startswith("event:") else value
 
 
 def _ensure_tags(payload: dict) -> List[List[str]]:
@@ -1737,11 +2324,34 @@ def _finalize_payload_publish(payload: dict, event_id: str) -> None:
     payload["tags"] = _upsert_single_tag(tags, "eventid", event_id)
 
 
-def _tags_to_map(tags: List[tuple[str, str]]) -> dict:
-    mapped: dict[str, List[str]] = {}
-    for key, value in tags:
-        mapped.setdefault(key, []).append(value)
-    return mapped
+class _TagMap(dict):
+    @classmethod
+    def from_pairs(cls, tags: Iterable[tuple[str, str]]) -> "_TagMap":
+        mapped = cls()
+        for key, value in tags:
+            mapped.append(key, value)
+        return mapped
+
+    def append(self, key: str, value: str) -> None:
+        self.setdefault(key, []).append(value)
+
+    def upsert_single(self, key: str, value: str) -> None:
+        self.pop(key, None)
+        self[key] = [value]
+
+    def get_single(self, key: str) -> Optional[str]:
+        values = self.get(key)
+        return values[0] if values else None
+
+    def to_pairs(self) -> List[tuple[str, str]]:
+        return [(key, value) for key, values in self.items() for value in values]
+
+    def to_nested_list(self) -> List[List[str]]:
+        return [[key, value] for key, values in self.items() for value in values]
+
+
+def _tags_to_map(tags: List[tuple[str, str]]) -> _TagMap:
+    return _TagMap.from_pairs(tags)
 
 
 def _add_or_replace_tag(tags: List[tuple[str, str]], key: str, value: str) -> List[tuple[str, str]]:
@@ -1874,6 +2484,37 @@ def _endorsement_tags_from_inputs(
     return tags
 
 
+_JSON_TAG_FIELDS: Dict[int, tuple[tuple[str, bool], ...]] = {
+    30050: (
+        ("published_at", False),
+        ("summary", False),
+        ("t", True),
+        ("lang", False),
+        ("version", False),
+        ("supersedes", True),
+        ("license", False),
+        ("authors", True),
+        ("eventid", False),
+    ),
+    30051: (
+        ("authoritative", False),
+        ("steward", False),
+        ("previous", False),
+        ("reason", False),
+        ("effective_at", False),
+        ("eventid", False),
+    ),
+    30052: (
+        ("endorses", False),
+        ("role", True),
+        ("implementation", False),
+        ("note", False),
+        ("t", True),
+        ("eventid", False),
+    ),
+}
+
+
 def _json_tags_from_tuples(
     kind: int,
     d: str,
@@ -1881,66 +2522,25 @@ def _json_tags_from_tuples(
     tags: List[tuple[str, str]],
 ) -> List[List[str]]:
     tag_map = _tags_to_map(tags)
-    tags_list: List[List[str]] = []
-    tags_list.append(["d", d])
-    if kind == 30050:
-        if title:
-            tags_list.append(["title", title])
-        published_at = tag_map.get("published_at", [None])[0]
-        if published_at:
-            tags_list.append(["published_at", str(published_at)])
-        if "summary" in tag_map:
-            tags_list.append(["summary", tag_map["summary"][0]])
-        for topic in tag_map.get("t", []):
-            tags_list.append(["t", topic])
-        if "lang" in tag_map:
-            tags_list.append(["lang", tag_map["lang"][0]])
-        if "version" in tag_map:
-            tags_list.append(["version", tag_map["version"][0]])
-        for item in tag_map.get("supersedes", []):
-            tags_list.append(["supersedes", item])
-        if "license" in tag_map:
-            tags_list.append(["license", tag_map["license"][0]])
-        for author in tag_map.get("authors", []):
-            tags_list.append(["authors", author])
-        if "eventid" in tag_map:
-            tags_list.append(["eventid", tag_map["eventid"][0]])
-    elif kind == 30051:
-        if "authoritative" in tag_map:
-            tags_list.append(["authoritative", tag_map["authoritative"][0]])
-        if "steward" in tag_map:
-            tags_list.append(["steward", tag_map["steward"][0]])
-        if "previous" in tag_map:
-            tags_list.append(["previous", tag_map["previous"][0]])
-        if "reason" in tag_map:
-            tags_list.append(["reason", tag_map["reason"][0]])
-        if "effective_at" in tag_map:
-            tags_list.append(["effective_at", tag_map["effective_at"][0]])
-        if "eventid" in tag_map:
-            tags_list.append(["eventid", tag_map["eventid"][0]])
-    elif kind == 30052:
-        if "endorses" in tag_map:
-            tags_list.append(["endorses", tag_map["endorses"][0]])
-        for role in tag_map.get("role", []):
-            tags_list.append(["role", role])
-        if "implementation" in tag_map:
-            tags_list.append(["implementation", tag_map["implementation"][0]])
-        if "note" in tag_map:
-            tags_list.append(["note", tag_map["note"][0]])
-        for topic in tag_map.get("t", []):
-            tags_list.append(["t", topic])
-        if "eventid" in tag_map:
-            tags_list.append(["eventid", tag_map["eventid"][0]])
+    tags_list: List[List[str]] = [["d", d]]
+    if kind == 30050 and title:
+        tags_list.append(["title", title])
+    for key, multiple in _JSON_TAG_FIELDS.get(kind, ()):
+        values = tag_map.get(key)
+        if not values:
+            continue
+        if multiple:
+            tags_list.extend([key, value] for value in values)
+        else:
+            tags_list.append([key, values[0]])
     return tags_list
 
 
-def _event_tags_from_tuples(
-    kind: int,
-    d: str,
-    title: Optional[str],
-    tags: List[tuple[str, str]],
-) -> List[Tag]:
-    return [Tag.parse(tag) for tag in _json_tags_from_tuples(kind, d, title, tags)]
+def _builder_from_payload(payload: dict) -> EventBuilder:
+    from nostr_sdk import EventBuilder, Kind, Tag
+    tags = [Tag.parse(tag) for tag in payload["tags"]]
+    builder = EventBuilder(Kind(int(payload["kind"])), payload["content"]).tags(tags)
+    return _set_builder_created_at(builder, payload.get("created_at"))
 
 
 def _payload_from_draft(kind: int, d: str, title: Optional[str], content: str, tags: List[tuple[str, str]], created_at: int) -> dict:
@@ -1951,7 +2551,38 @@ def _payload_from_draft(kind: int, d: str, title: Optional[str], content: str, t
         "content": content,
     }
     return payload
+def _draft_json_matches(payload: object, kind: int, identifier: str) -> bool:
+    if not isinstance(payload, dict):
+        return False
+    if payload.get("kind") != kind:
+        return False
+    tags = payload.get("tags", [])
+    if not isinstance(tags, list):
+        return False
+    return _extract_tag_value(tags, "d") == identifier
+
+
 def _find_latest_draft(kind: int, identifier: str, cwd: str) -> Optional[tuple[str, dict]]:
+    # Output files are named {identifier}_{published_at}.json, so the
+    # filename alone orders the likely matches without opening them.
+    prefix = f"{identifier}_"
+    candidates: List[tuple[int, str]] = []
+    for path in glob.glob(os.path.join(glob.escape(cwd), f"{glob.escape(identifier)}_*.json")):
+        stamp = os.path.basename(path)[len(prefix):-len(".json")]
+        if stamp.isdigit():
+            candidates.append((int(stamp), path))
+    candidates.sort(reverse=True)
+    for _, path in candidates:
+        try:
+            payload = _load_json(path)
+        except Exception:
+            continue
+        if _draft_json_matches(payload, kind, identifier):
+            return path, payload
+    return _scan_latest_draft(kind, identifier, cwd)
+
+
+def _scan_latest_draft(kind: int, identifier: str, cwd: str) -> Optional[tuple[str, dict]]:
     candidates: List[tuple[str, int]] = []
     for name in os.listdir(cwd):
         if not name.endswith(".json"):
@@ -1961,15 +2592,7 @@ def _find_latest_draft(kind: int, identifier: str, cwd: str) -> Optional[tuple[s
             payload = _load_json(path)
         except Exception:
             continue
-        if not isinstance(payload, dict):
-            continue
-        if payload.get("kind") != kind:
-            continue
-        tags = payload.get("tags", [])
-        if not isinstance(tags, list):
-            continue
-        d_tag = _extract_tag_value(tags, "d")
-        if d_tag != identifier:
+        if not _draft_json_matches(payload, kind, identifier):
             continue
         created_at = payload.get("created_at")
         if isinstance(created_at, int):
@@ -1986,39 +2609,129 @@ def _find_latest_draft(kind: int, identifier: str, cwd: str) -> Optional[tuple[s
     return latest_path, _load_json(latest_path)
 
 
+# Kind targeted by each per-kind command, so handlers look it up instead of
+# re-testing the command string.
+_COMMAND_KINDS = {
+    "/list-ncc": 30050,
+    "/list-nsr": 30051,
+    "/list-endorsements": 30052,
+    "/publish-ncc": 30050,
+    "/publish-nsr": 30051,
+    "/publish-endorsement": 30052,
+    "/verify-ncc": 30050,
+    "/verify-nsr": 30051,
+    "/verify-endorsement": 30052,
+}
+
+_HELP_TEXT = "\n".join(
+    [
+        "Commands:",
+        "  /init-config",
+        "  /edit-config",
+        "  /create-ncc",
+        "  /create-nsr",
+        "  /create-endorsement",
+        "  /revise-ncc",
+        "  /revise-nsr",
+        "  /revise-endorsement",
+        "  /list-ncc",
+        "  /list-nsr",
+        "  /list-endorsements",
+        "  /publish-ncc",
+        "  /publish-nsr",
+        "  /publish-endorsement",
+        "  /verify-ncc",
+        "  /verify-nsr",
+        "  /verify-endorsement",
+        "  /add-relay",
+        "  /remove-relay",
+        "  /quit",
+        "",
+        "Details:",
+        "  /init-config  Initialize default config in the database.",
+        "  /edit-config  Edit config stored in the database (prompted).",
+        "  /create-ncc   Create a draft NCC JSON file.",
+        "  /create-nsr   Create a draft succession record JSON file.",
+        "  /create-endorsement   Create a draft endorsement JSON file.",
+        "  /revise-ncc   Revise an existing NCC draft JSON file.",
+        "  /revise-nsr   Revise an existing succession record JSON file.",
+        "  /revise-endorsement   Revise an existing endorsement JSON file.",
+        "  /list-ncc     List NCC drafts in the database.",
+        "  /list-nsr     List succession record drafts in the database.",
+        "  /list-endorsements     List endorsement drafts in the database.",
+        "  /publish-ncc  Publish the latest NCC draft JSON file.",
+        "  /publish-nsr  Publish the latest succession record JSON file.",
+        "  /publish-endorsement  Publish the latest endorsement JSON file.",
+        "  /verify-ncc   Verify published NCC event id on relays.",
+        "  /verify-nsr   Verify published NSR event id on relays.",
+        "  /verify-endorsement   Verify published endorsement event id on relays.",
+        "  /add-relay    Add a relay to config.",
+        "  /remove-relay Remove a relay from config.",
+        "  /quit         Exit interactive mode.",
+        "",
+        "Getting started:",
+        "  1) /init-config",
+        "  2) /edit-config",
+        "  3) /create-ncc",
+        "  4) /publish-ncc",
+    ]
+)
+
+
+_COMMAND_META = {
+    "/init-config": "Initialize default config in the database.",
+    "/edit-config": "Edit config stored in the database (prompted).",
+    "/create-ncc": "Create a draft NCC JSON file.",
+    "/create-nsr": "Create a draft succession record JSON file.",
+    "/create-endorsement": "Create a draft endorsement JSON file.",
+    "/revise-ncc": "Revise an existing NCC draft JSON file.",
+    "/revise-nsr": "Revise an existing succession record JSON file.",
+    "/revise-endorsement": "Revise an existing endorsement JSON file.",
+    "/list-ncc": "List NCC drafts in the database.",
+    "/list-nsr": "List succession record drafts in the database.",
+    "/list-endorsements": "List endorsement drafts in the database.",
+    "/publish-ncc": "Publish the latest NCC draft JSON file.",
+    "/publish-nsr": "Publish the latest succession record JSON file.",
+    "/publish-endorsement": "Publish the latest endorsement JSON file.",
+    "/verify-ncc": "Verify published NCC event id on relays.",
+    "/verify-nsr": "Verify published NSR event id on relays.",
+    "/verify-endorsement": "Verify published endorsement event id on relays.",
+    "/add-relay": "Add a relay to config.",
+    "/remove-relay": "Remove a relay from config.",
+    "/help": "Show available commands.",
+    "/quit": "Exit interactive mode.",
+}
+_COMMANDS = list(_COMMAND_META)
+
+
 def _interactive_cli() -> None:
+    # Let a command's output collect in the stdout buffer and go out in one
+    # write when the next prompt is shown, rather than one write per line.
+    # Line buffering is restored on the way out, after a final flush, so
+    # the rest of the process (and any traceback on stderr) sees stdout as
+    # it was.
+    line_buffered = getattr(sys.stdout, "line_buffering", False)
+    if line_buffered:
+        sys.stdout.reconfigure(line_buffering=False)
+    try:
+        _interactive_cli_loop()
+    finally:
+        sys.stdout.flush()
+        if line_buffered:
+            sys.stdout.reconfigure(line_buffering=True)
+
+
+def _interactive_cli_loop() -> None:
     separator = "-" * 72
-    command_meta = {
-        "/init-config": "Initialize default config in the database.",
-        "/edit-config": "Edit config stored in the database (prompted).",
-        "/create-ncc": "Create a draft NCC JSON file.",
-        "/create-nsr": "Create a draft succession record JSON file.",
-        "/create-endorsement": "Create a draft endorsement JSON file.",
-        "/revise-ncc": "Revise an existing NCC draft JSON file.",
-        "/revise-nsr": "Revise an existing succession record JSON file.",
-        "/revise-endorsement": "Revise an existing endorsement JSON file.",
-        "/list-ncc": "List NCC drafts in the database.",
-        "/list-nsr": "List succession record drafts in the database.",
-        "/list-endorsements": "List endorsement drafts in the database.",
-        "/publish-ncc": "Publish the latest NCC draft JSON file.",
-        "/publish-nsr": "Publish the latest succession record JSON file.",
-        "/publish-endorsement": "Publish the latest endorsement JSON file.",
-        "/verify-ncc": "Verify published NCC event id on relays.",
-        "/verify-nsr": "Verify published NSR event id on relays.",
-        "/verify-endorsement": "Verify published endorsement event id on relays.",
-        "/add-relay": "Add a relay to config.",
-        "/remove-relay": "Remove a relay from config.",
-        "/help": "Show available commands.",
-        "/quit": "Exit interactive mode.",
-    }
-    commands = list(command_meta)
-    read_command = _build_command_prompt(commands, meta=command_meta)
+    read_command = _build_command_prompt(_COMMANDS, meta=_COMMAND_META)
     print("NCC publisher")
     print("Type /help for commands.")
-    _start_publish_queue_worker(print)
+    _start_publish_queue_worker(functools.partial(print, flush=True))
+    config_path = _default_config_path()
     while True:
         print("")
         print(separator)
+        sys.stdout.flush()
         command = read_command()
         if not command:
             continue
@@ -2030,59 +2743,10 @@ def _interactive_cli() -> None:
             return
 
         if command in ("/help", "?"):
-            print("Commands:")
-            print("  /init-config")
-            print("  /edit-config")
-            print("  /create-ncc")
-            print("  /create-nsr")
-            print("  /create-endorsement")
-            print("  /revise-ncc")
-            print("  /revise-nsr")
-            print("  /revise-endorsement")
-            print("  /list-ncc")
-            print("  /list-nsr")
-            print("  /list-endorsements")
-            print("  /publish-ncc")
-            print("  /publish-nsr")
-            print("  /publish-endorsement")
-            print("  /verify-ncc")
-            print("  /verify-nsr")
-            print("  /verify-endorsement")
-            print("  /add-relay")
-            print("  /remove-relay")
-            print("  /quit")
-            print("")
-            print("Details:")
-            print("  /init-config  Initialize default config in the database.")
-            print("  /edit-config  Edit config stored in the database (prompted).")
-            print("  /create-ncc   Create a draft NCC JSON file.")
-            print("  /create-nsr   Create a draft succession record JSON file.")
-            print("  /create-endorsement   Create a draft endorsement JSON file.")
-            print("  /revise-ncc   Revise an existing NCC draft JSON file.")
-            print("  /revise-nsr   Revise an existing succession record JSON file.")
-            print("  /revise-endorsement   Revise an existing endorsement JSON file.")
-            print("  /list-ncc     List NCC drafts in the database.")
-            print("  /list-nsr     List succession record drafts in the database.")
-            print("  /list-endorsements     List endorsement drafts in the database.")
-            print("  /publish-ncc  Publish the latest NCC draft JSON file.")
-            print("  /publish-nsr  Publish the latest succession record JSON file.")
-            print("  /publish-endorsement  Publish the latest endorsement JSON file.")
-            print("  /verify-ncc   Verify published NCC event id on relays.")
-            print("  /verify-nsr   Verify published NSR event id on relays.")
-            print("  /verify-endorsement   Verify published endorsement event id on relays.")
-            print("  /add-relay    Add a relay to config.")
-            print("  /remove-relay Remove a relay from config.")
-            print("  /quit         Exit interactive mode.")
-            print("")
-            print("Getting started:")
-            print("  1) /init-config")
-            print("  2) /edit-config")
-            print("  3) /create-ncc")
-            print("  4) /publish-ncc")
+            print(_HELP_TEXT)
             continue
 
         if command == "/init-config":
-            config_path = _default_config_path()
             store = DraftStore(config_path)
             if store.config_exists():
                 confirm = _prompt_value("Config exists. Reset? (y/n)", "n", required=False)
@@ -2098,7 +2762,6 @@ def _interactive_cli() -> None:
                 continue
 
         if command == "/edit-config":
-            config_path = _default_config_path()
             store = DraftStore(config_path)
             if not store.config_exists():
                 store.save_config(_default_config())
@@ -2110,9 +2773,10 @@ def _interactive_cli() -> None:
                 config.get("privkey") if isinstance(config, dict) else None,
                 required=False,
             )
-            if privkey:
+            # Values kept from the stored config were validated when saved.
+            if privkey and privkey != (config.get("privkey") if isinstance(config, dict) else None):
                 try:
-                    Keys.parse(privkey)
+                    _parse_keys(privkey)
                 except Exception:
                     print("Error: privkey must be nsec or hex.")
                     continue
@@ -2137,7 +2801,7 @@ def _interactive_cli() -> None:
             reason = _prompt_value("Reason (optional)", tags.get("reason"), required=False)
             effective_at = _prompt_value("Effective at (optional)", tags.get("effective_at"), required=False)
             authors_list = _normalize_list(authors)
-            if authors_list:
+            if authors_list and authors_list != tags.get("authors"):
                 authors_list = _validate_author_keys(authors_list)
             updated = {
                 "privkey": privkey or "",
@@ -2156,13 +2820,14 @@ def _interactive_cli() -> None:
                     "effective_at": _normalize_optional_str(effective_at) or "",
                 },
             }
+            if updated == config:
+                print("Config unchanged.")
+                continue
             store.save_config(updated)
             print(f"Updated config in database at {config_path}")
             continue
 
         if command == "/create-ncc":
-            default_path = _default_config_path()
-            config_path = default_path
             store = DraftStore(config_path)
             config = store.load_config()
             config_tags = config.get("tags", {}) if isinstance(config, dict) else {}
@@ -2181,12 +2846,16 @@ def _interactive_cli() -> None:
             title_value = _prompt_value("Title", required=True)
             default_content_path = _default_ncc_content_path(d_value)
             content_path = _prompt_value("Content path", default_content_path, required=True)
+            content = None
             if not os.path.exists(content_path):
-                _write_text_file(content_path, _ncc_template_content())
+                content = _ncc_template_content(title_value)
+                _write_text_file(content_path, content)
             open_now = _prompt_value("Open editor now? (y/n)", "y", required=False)
             if _is_truthy_response(open_now):
-                _open_in_editor(content_path)
-            content = _load_content_from_path(content_path)
+                if _open_in_editor(content_path):
+                    content = None
+            if content is None:
+                content = _load_content_from_path(content_path)
             summary = _prompt_value("Summary (optional)", config_tags.get("summary"), required=False)
             topics = _prompt_value(
                 "Topics (comma-separated, optional)",
@@ -2208,14 +2877,14 @@ def _interactive_cli() -> None:
             except ValueError as exc:
                 print(f"Error: {exc}")
                 continue
-            content = content.replace("# Title", f"# {title_value}", 1)
+            content = _apply_title_heading(content, title_value)
             tags = _ncc_tags_from_inputs(
-                summary=_normalize_optional_str(summary) or config_tags.get("summary"),
+                summary=_pick_optional(summary, config_tags.get("summary")),
                 topics=_normalize_list(topics) or _normalize_list(config_tags.get("topics")),
-                lang=_normalize_optional_str(lang) or config_tags.get("lang"),
-                version=_normalize_optional_str(version) or config_tags.get("version"),
+                lang=_pick_optional(lang, config_tags.get("lang")),
+                version=_pick_optional(version, config_tags.get("version")),
                 supersedes=_normalize_list(supersedes) or _normalize_list(config_tags.get("supersedes")),
-                license_id=_normalize_optional_str(license_id) or config_tags.get("license"),
+                license_id=_pick_optional(license_id, config_tags.get("license")),
                 authors=authors_list,
             )
             draft_id = store.insert_draft(
@@ -2239,9 +2908,8 @@ def _interactive_cli() -> None:
             if not d_value:
                 print("Cancelled.")
                 continue
-            config_path = _default_config_path()
             store = DraftStore(config_path)
-            draft = store.get_latest_draft(30050, d_value)
+            draft, tags = store.get_latest_draft_with_tags(30050, d_value)
             base_event_id = draft["event_id"] if draft and draft["event_id"] else None
             base_is_published = bool(draft and (draft["status"] == "published" or base_event_id))
             if not draft:
@@ -2261,23 +2929,22 @@ def _interactive_cli() -> None:
                     tags=tags,
                 )
                 draft = {"id": draft_id, "title": title_value, "content": content_seed}
-            else:
-                tags = store.get_tags(draft["id"])
             tag_map = _tags_to_map(tags)
             if base_is_published and base_event_id:
                 print(f"Note: editing a published NCC will create a new draft superseding event {base_event_id}.")
             title_value = _prompt_value("Title", draft["title"], required=True)
             default_content_path = _default_ncc_content_path(d_value)
             content_path = _prompt_value("Content path", default_content_path, required=True)
-            _write_text_file(content_path, draft["content"] or _ncc_template_content())
+            content = draft["content"] or _ncc_template_content(title_value)
+            _write_text_file(content_path, content)
             open_now = _prompt_value("Open editor now? (y/n)", "y", required=False)
             if _is_truthy_response(open_now):
-                _open_in_editor(content_path)
-            content = _load_content_from_path(content_path)
-            summary = _prompt_value("Summary (optional)", tag_map.get("summary", [None])[0], required=False)
+                if _open_in_editor(content_path):
+                    content = _load_content_from_path(content_path)
+            summary = _prompt_value("Summary (optional)", tag_map.get_single("summary"), required=False)
             topics = _prompt_value("Topics (comma-separated, optional)", _format_list_default(tag_map.get("t")), required=False)
-            lang = _prompt_value("Lang (optional)", tag_map.get("lang", [None])[0], required=False)
-            version = _prompt_value("Version (optional)", tag_map.get("version", [None])[0], required=False)
+            lang = _prompt_value("Lang (optional)", tag_map.get_single("lang"), required=False)
+            version = _prompt_value("Version (optional)", tag_map.get_single("version"), required=False)
             supersedes_default = list(tag_map.get("supersedes", []))
             if base_is_published and base_event_id:
                 supersedes_default.append(f"event:{base_event_id}")
@@ -2286,7 +2953,7 @@ def _interactive_cli() -> None:
                 _format_list_default(supersedes_default),
                 required=False,
             )
-            license_id = _prompt_value("License (optional)", tag_map.get("license", [None])[0], required=False)
+            license_id = _prompt_value("License (optional)", tag_map.get_single("license"), required=False)
             authors = _prompt_value(
                 "Authors (npub or hex pubkey; comma-separated, optional)",
                 _format_list_default(tag_map.get("authors")),
@@ -2297,7 +2964,7 @@ def _interactive_cli() -> None:
             except ValueError as exc:
                 print(f"Error: {exc}")
                 continue
-            content = content.replace("# Title", f"# {title_value}", 1)
+            content = _apply_title_heading(content, title_value)
             tags = _ncc_tags_from_inputs(
                 summary=_normalize_optional_str(summary),
                 topics=_parse_list_value(topics),
@@ -2340,9 +3007,8 @@ def _interactive_cli() -> None:
             if not d_value:
                 print("Cancelled.")
                 continue
-            config_path = _default_config_path()
             store = DraftStore(config_path)
-            draft = store.get_latest_draft(30051, d_value)
+            draft, tags = store.get_latest_draft_with_tags(30051, d_value)
             base_event_id = draft["event_id"] if draft and draft["event_id"] else None
             base_is_published = bool(draft and (draft["status"] == "published" or base_event_id))
             if not draft:
@@ -2361,33 +3027,32 @@ def _interactive_cli() -> None:
                     tags=tags,
                 )
                 draft = {"id": draft_id, "content": content_seed}
-            else:
-                tags = store.get_tags(draft["id"])
             tag_map = _tags_to_map(tags)
             if base_is_published and base_event_id:
                 print(f"Note: editing a published NSR will create a new draft superseding event {base_event_id}.")
             authoritative_event = _prompt_value(
                 "Authoritative event id",
-                _strip_event_prefix(tag_map.get("authoritative", [None])[0]),
+                _strip_event_prefix(tag_map.get_single("authoritative")),
                 required=True,
             )
             default_content_path = _default_ncc_content_path(d_value)
             content_path = _prompt_value("Content path", default_content_path, required=True)
-            _write_text_file(content_path, draft["content"] or "Steward acknowledges updated NCC document.")
+            content = draft["content"] or "Steward acknowledges updated NCC document."
+            _write_text_file(content_path, content)
             open_now = _prompt_value("Open editor now? (y/n)", "y", required=False)
             if _is_truthy_response(open_now):
-                _open_in_editor(content_path)
-            content = _load_content_from_path(content_path)
-            steward = _prompt_value("Steward (optional)", tag_map.get("steward", [None])[0], required=False)
+                if _open_in_editor(content_path):
+                    content = _load_content_from_path(content_path)
+            steward = _prompt_value("Steward (optional)", tag_map.get_single("steward"), required=False)
             previous = _prompt_value(
                 "Previous event id (optional)",
-                _strip_event_prefix(tag_map.get("previous", [None])[0]),
+                _strip_event_prefix(tag_map.get_single("previous")),
                 required=False,
             )
-            reason = _prompt_value("Reason (optional)", tag_map.get("reason", [None])[0], required=False)
+            reason = _prompt_value("Reason (optional)", tag_map.get_single("reason"), required=False)
             effective_at = _prompt_value(
                 "Effective at (optional)",
-                tag_map.get("effective_at", [None])[0],
+                tag_map.get_single("effective_at"),
                 required=False,
             )
             tags = _nsr_tags_from_inputs(
@@ -2430,9 +3095,8 @@ def _interactive_cli() -> None:
             if not d_value:
                 print("Cancelled.")
                 continue
-            config_path = _default_config_path()
             store = DraftStore(config_path)
-            draft = store.get_latest_draft(30052, d_value)
+            draft, tags = store.get_latest_draft_with_tags(30052, d_value)
             base_event_id = draft["event_id"] if draft and draft["event_id"] else None
             base_is_published = bool(draft and (draft["status"] == "published" or base_event_id))
             if not draft:
@@ -2451,27 +3115,25 @@ def _interactive_cli() -> None:
                     tags=tags,
                 )
                 draft = {"id": draft_id, "content": content_seed}
-            else:
-                tags = store.get_tags(draft["id"])
             tag_map = _tags_to_map(tags)
             if base_is_published and base_event_id:
                 print(f"Note: editing a published endorsement will create a new draft superseding event {base_event_id}.")
             published = _get_published_ncc_events(config_path, d_value)
             if published:
                 print("Published NCC events:")
-                for line in _format_published_ncc_event_choices(published):
-                    print(line)
+                print("\n".join(_format_published_ncc_event_choices(published)))
             else:
                 print("No published NCC events found for that identifier.")
-            endorses_default = _strip_event_prefix(tag_map.get("endorses", [None])[0])
+            endorses_default = _strip_event_prefix(tag_map.get_single("endorses"))
             endorses_event = _prompt_value("Endorses event id", endorses_default, required=True)
             default_content_path = _default_ncc_content_path(d_value)
             content_path = _prompt_value("Content path", default_content_path, required=True)
-            _write_text_file(content_path, draft["content"] or "Endorsed.")
+            content = draft["content"] or "Endorsed."
+            _write_text_file(content_path, content)
             open_now = _prompt_value("Open editor now? (y/n)", "y", required=False)
             if _is_truthy_response(open_now):
-                _open_in_editor(content_path)
-            content = _load_content_from_path(content_path)
+                if _open_in_editor(content_path):
+                    content = _load_content_from_path(content_path)
             roles = _prompt_value(
                 "Role (author/client/user, comma-separated, optional)",
                 _format_list_default(tag_map.get("role")),
@@ -2479,10 +3141,10 @@ def _interactive_cli() -> None:
             )
             implementation = _prompt_value(
                 "Implementation (optional)",
-                tag_map.get("implementation", [None])[0],
+                tag_map.get_single("implementation"),
                 required=False,
             )
-            note = _prompt_value("Note (optional)", tag_map.get("note", [None])[0], required=False)
+            note = _prompt_value("Note (optional)", tag_map.get_single("note"), required=False)
             topics = _prompt_value(
                 "Topics (comma-separated, optional)",
                 _format_list_default(tag_map.get("t")),
@@ -2527,8 +3189,6 @@ def _interactive_cli() -> None:
             continue
 
         if command == "/create-nsr":
-            default_path = _default_config_path()
-            config_path = default_path
             store = DraftStore(config_path)
             config = store.load_config()
             config_tags = config.get("tags", {}) if isinstance(config, dict) else {}
@@ -2566,7 +3226,6 @@ def _interactive_cli() -> None:
             continue
 
         if command == "/create-endorsement":
-            config_path = _default_config_path()
             store = DraftStore(config_path)
             d_value = _prompt_value("NCC number (e.g. 01)", required=True)
             d_value = _format_ncc_identifier(d_value)
@@ -2576,8 +3235,7 @@ def _interactive_cli() -> None:
             published = _get_published_ncc_events(config_path, d_value)
             if published:
                 print("Published NCC events:")
-                for line in _format_published_ncc_event_choices(published):
-                    print(line)
+                print("\n".join(_format_published_ncc_event_choices(published)))
             else:
                 print("No published NCC events found for that identifier.")
             endorses_event = _prompt_value("Endorses event id", required=True)
@@ -2614,13 +3272,7 @@ def _interactive_cli() -> None:
             continue
 
         if command in ("/list-ncc", "/list-nsr", "/list-endorsements"):
-            if command == "/list-ncc":
-                kind = 30050
-            elif command == "/list-nsr":
-                kind = 30051
-            else:
-                kind = 30052
-            config_path = _default_config_path()
+            kind = _COMMAND_KINDS[command]
             store = DraftStore(config_path)
             if kind == 30050:
                 fetch = _prompt_value("Fetch proposals from relays? (y/n)", "n", required=False)
@@ -2656,18 +3308,20 @@ def _interactive_cli() -> None:
                 privkey = config.get("privkey") if isinstance(config, dict) else None
                 if privkey:
                     try:
-                        pubkey_hex = Keys.parse(privkey).public_key().to_hex()
+                        pubkey_hex = _parse_keys(privkey).public_key().to_hex()
                     except Exception:
                         pubkey_hex = None
                 local_identifiers, local_event_ids = _get_local_ncc_targets(config_path, pubkey_hex)
+            tags_by_draft = store.get_tags_by_draft(kind) if kind != 30051 else {}
+            lines = []
             for row in rows:
                 title = row["title"] or "-"
-                updated_at = _format_ts(row["updated_at"])
+                updated_at = row["updated_fmt"]
                 status = row["status"] or "draft"
-                published_at = _format_ts(row["published_at"])
+                published_at = row["published_fmt"]
                 event_id = row["event_id"] or "-"
                 if kind == 30050:
-                    tags = store.get_tags(row["id"])
+                    tags = tags_by_draft.get(row["id"], [])
                     labels = _classify_ncc_row(
                         row,
                         tags,
@@ -2677,29 +3331,24 @@ def _interactive_cli() -> None:
                     )
                     label_text = ", ".join(labels)
                     endorsement_count = endorsement_counts.get(row["event_id"] or "", 0)
-                    print(
+                    lines.append(
                         f"  #{row['id']} {row['d']} {title} | {status} | {label_text} | endorsements {endorsement_count} | updated {updated_at} | published {published_at} | event {event_id}"
                     )
                 elif kind == 30051:
-                    print(
+                    lines.append(
                         f"  #{row['id']} {row['d']} {title} | {status} | updated {updated_at} | published {published_at} | event {event_id}"
                     )
                 else:
-                    tags = store.get_tags(row["id"])
+                    tags = tags_by_draft.get(row["id"], [])
                     endorses = _extract_endorsement_fields_from_tags(tags)[0] or "-"
-                    print(
+                    lines.append(
                         f"  #{row['id']} {row['d']} endorses {endorses} | {status} | updated {updated_at} | published {published_at} | event {event_id}"
                     )
+            print("\n".join(lines))
             continue
 
         if command in ("/publish-ncc", "/publish-nsr", "/publish-endorsement"):
-            if command == "/publish-ncc":
-                kind = 30050
-            elif command == "/publish-nsr":
-                kind = 30051
-            else:
-                kind = 30052
-            config_path = _default_config_path()
+            kind = _COMMAND_KINDS[command]
             store = DraftStore(config_path)
             service = PublishService(config_path)
             config = store.load_config()
@@ -2714,8 +3363,7 @@ def _interactive_cli() -> None:
             if not unpublished:
                 print("  (none)")
             else:
-                for line in _format_unpublished_drafts(unpublished):
-                    print(line)
+                print("\n".join(_format_unpublished_drafts(unpublished)))
             selection = _prompt_value("Draft id or NCC number (e.g. 01)", required=True)
             draft = None
             if selection.isdigit():
@@ -2747,7 +3395,7 @@ def _interactive_cli() -> None:
                 config.get("privkey") if isinstance(config, dict) else None,
                 required=True,
             )
-            keys = Keys.parse(privkey)
+            keys = _parse_keys(privkey)
             succession_info: Optional[tuple[str, Optional[str], Optional[str]]] = None
             if draft is None:
                 draft = store.get_latest_draft(kind, d_value)
@@ -2788,30 +3436,19 @@ def _interactive_cli() -> None:
                     except ValueError as exc:
                         print(f"Error: {exc}")
                         continue
-                print("Publishing event...")
-                try:
-                    with _PUBLISH_LOCK:
-                        event_id = service.publish_json(json_path, relays=relays, keys=keys)
-                except Exception as exc:
-                    service.enqueue_task(
-                        {
-                            "type": "json",
-                            "config_path": config_path,
-                            "json_path": json_path,
-                            "relays": relays,
-                        }
-                    )
-                    print(f"Publish failed: {exc}. Queued for retry.")
-                    continue
-                if kind == 30051 and succession_info:
-                    authoritative, previous, steward = succession_info
-                    _apply_succession_updates(
-                        config_path=config_path,
-                        authoritative_event=authoritative,
-                        previous_event=previous,
-                        steward=steward,
-                        succession_event_id=event_id,
-                    )
+                _submit_publish_task(
+                    service,
+                    {
+                        "type": "json",
+                        "config_path": config_path,
+                        "json_path": json_path,
+                        "relays": relays,
+                        "next_attempt_at": _now(),
+                    },
+                    privkey=privkey,
+                    keys=keys,
+                    output=print,
+                )
                 continue
             tags = store.get_tags(draft["id"])
             draft_kind = draft["kind"]
@@ -2841,56 +3478,23 @@ def _interactive_cli() -> None:
                 except ValueError as exc:
                     print(f"Error: {exc}")
                     continue
-            payload = _payload_from_draft(draft["kind"], draft["d"], draft["title"], draft["content"], tags, _now())
-            print("Publishing event...")
-            try:
-                with _PUBLISH_LOCK:
-                    event_id = service.publish_payload(payload, relays=relays, keys=keys)
-            except Exception as exc:
-                service.enqueue_task(
-                    {
-                        "type": "draft",
-                        "config_path": config_path,
-                        "draft_id": int(draft["id"]),
-                        "relays": relays,
-                    }
-                )
-                print(f"Publish failed: {exc}. Queued for retry.")
-                continue
-            if kind == 30051 and succession_info:
-                authoritative, previous, steward = succession_info
-                _apply_succession_updates(
-                    config_path=config_path,
-                    authoritative_event=authoritative,
-                    previous_event=previous,
-                    steward=steward,
-                    succession_event_id=event_id,
-                )
-            published_at = _now() if draft["kind"] == 30050 else None
-            tags = _add_or_replace_tag(tags, "eventid", event_id)
-            if published_at is not None:
-                tags = _add_or_replace_tag(tags, "published_at", str(published_at))
-            store.update_draft(
-                draft_id=int(draft["id"]),
-                title=draft["title"],
-                content=draft["content"],
-                tags=tags,
-                status="published",
-                published_at=published_at,
-                event_id=event_id,
-                source="local",
-                author_pubkey=keys.public_key().to_hex(),
+            _submit_publish_task(
+                service,
+                {
+                    "type": "draft",
+                    "config_path": config_path,
+                    "draft_id": int(draft["id"]),
+                    "relays": relays,
+                    "next_attempt_at": _now(),
+                },
+                privkey=privkey,
+                keys=keys,
+                output=print,
             )
             continue
 
         if command in ("/verify-ncc", "/verify-nsr", "/verify-endorsement"):
-            if command == "/verify-ncc":
-                kind = 30050
-            elif command == "/verify-nsr":
-                kind = 30051
-            else:
-                kind = 30052
-            config_path = _default_config_path()
+            kind = _COMMAND_KINDS[command]
             store = DraftStore(config_path)
             service = PublishService(config_path)
             config = store.load_config()
@@ -2905,8 +3509,7 @@ def _interactive_cli() -> None:
             if not published:
                 print("  (none)")
                 continue
-            for line in _format_published_drafts(published):
-                print(line)
+            print("\n".join(_format_published_drafts(published)))
             selection = _prompt_value("Draft id or NCC number (e.g. 01)", required=True)
             draft = None
             if selection.isdigit():
@@ -2946,7 +3549,6 @@ def _interactive_cli() -> None:
             continue
 
         if command == "/add-relay":
-            config_path = _default_config_path()
             config = _load_config_or_default(config_path, _default_config())
             relays = config.get("relays") if isinstance(config, dict) else []
             relays = list(relays or [])
@@ -2964,7 +3566,6 @@ def _interactive_cli() -> None:
             continue
 
         if command == "/remove-relay":
-            config_path = _default_config_path()
             config = _load_config_or_default(config_path, _default_config())
             relays = config.get("relays") if isinstance(config, dict) else []
             relays = list(relays or [])
@@ -2972,8 +3573,7 @@ def _interactive_cli() -> None:
                 print("No relays configured.")
                 continue
             print("Configured relays:")
-            for line in _format_relay_list(relays):
-                print(line)
+            print("\n".join(_format_relay_list(relays)))
             selection = _prompt_value("Relay index or url to remove", required=True)
             relay = selection
             if selection.isdigit():
@@ -2991,13 +3591,174 @@ def _interactive_cli() -> None:
             print(f"Removed relay: {relay}")
             continue
 
-        print("Error: unknown command. Type /help for options.")
+        print("Error: unknown command. Type /help for options.")
+
+
+# Kind handled by each TUI flow mode that branches on it.
+_FLOW_KINDS = {
+    "revise-ncc": 30050,
+    "revise-nsr": 30051,
+    "revise-endorsement": 30052,
+    "revise-ncc-path": 30050,
+    "revise-nsr-path": 30051,
+    "revise-endorsement-path": 30052,
+    "publish-ncc": 30050,
+    "publish-nsr": 30051,
+    "publish-endorsement": 30052,
+    "publish-ncc-path": 30050,
+    "publish-nsr-path": 30051,
+    "publish-endorsement-path": 30052,
+}
+
+_REVISE_EDIT_MODES = {30050: "revise-ncc-edit", 30051: "revise-nsr-edit", 30052: "revise-endorsement-edit"}
+
+
+def _revise_flow_steps(
+    kind: int,
+    tag_map: _TagMap,
+    *,
+    title: Optional[str],
+    supersedes: List[str],
+) -> List[dict]:
+    # Shared by the TUI revise flows for stored drafts and for imported JSON.
+    if kind == 30050:
+        return [
+            {"key": "title", "label": "Title", "default": title, "required": True},
+            {"key": "content_path", "label": "Content path", "default": None, "required": True},
+            {"key": "open_editor", "label": "Open editor now? (y/n)", "default": "y", "required": False},
+            {
+                "key": "summary",
+                "label": "Summary (optional)",
+                "default": tag_map.get_single("summary"),
+                "required": False,
+            },
+            {
+                "key": "topics",
+                "label": "Topics (comma-separated, optional)",
+                "default": _format_list_default(tag_map.get("t")),
+                "required": False,
+            },
+            {"key": "lang", "label": "Lang (optional)", "default": tag_map.get_single("lang"), "required": False},
+            {
+                "key": "version",
+                "label": "Version (optional)",
+                "default": tag_map.get_single("version"),
+                "required": False,
+            },
+            {
+                "key": "supersedes",
+                "label": "Supersedes (event id, optional)",
+                "default": _format_list_default(supersedes),
+                "required": False,
+            },
+            {
+                "key": "license",
+                "label": "License (optional)",
+                "default": tag_map.get_single("license"),
+                "required": False,
+            },
+            {
+                "key": "authors",
+                "label": "Authors (npub or hex pubkey; comma-separated, optional)",
+                "default": _format_list_default(tag_map.get("authors")),
+                "required": False,
+            },
+            {"key": "out_path", "label": "Export JSON path (optional)", "default": None, "required": False},
+        ]
+    if kind == 30051:
+        return [
+            {
+                "key": "authoritative_event",
+                "label": "Authoritative event id",
+                "default": _strip_event_prefix(tag_map.get_single("authoritative")),
+                "required": True,
+            },
+            {"key": "content_path", "label": "Content path", "default": None, "required": True},
+            {"key": "open_editor", "label": "Open editor now? (y/n)", "default": "y", "required": False},
+            {
+                "key": "steward",
+                "label": "Steward (optional)",
+                "default": tag_map.get_single("steward"),
+                "required": False,
+            },
+            {
+                "key": "previous",
+                "label": "Previous event id (optional)",
+                "default": _strip_event_prefix(tag_map.get_single("previous")),
+                "required": False,
+            },
+            {
+                "key": "reason",
+                "label": "Reason (optional)",
+                "default": tag_map.get_single("reason"),
+                "required": False,
+            },
+            {
+                "key": "effective_at",
+                "label": "Effective at (optional)",
+                "default": tag_map.get_single("effective_at"),
+                "required": False,
+            },
+            {"key": "out_path", "label": "Export JSON path (optional)", "default": None, "required": False},
+        ]
+    return [
+        {
+            "key": "endorses_event",
+            "label": "Endorses event id",
+            "default": _strip_event_prefix(tag_map.get_single("endorses")),
+            "required": True,
+        },
+        {"key": "content_path", "label": "Content path", "default": None, "required": True},
+        {"key": "open_editor", "label": "Open editor now? (y/n)", "default": "y", "required": False},
+        {
+            "key": "roles",
+            "label": "Role (author/client/user, comma-separated, optional)",
+            "default": _format_list_default(tag_map.get("role")),
+            "required": False,
+        },
+        {
+            "key": "implementation",
+            "label": "Implementation (optional)",
+            "default": tag_map.get_single("implementation"),
+            "required": False,
+        },
+        {
+            "key": "note",
+            "label": "Note (optional)",
+            "default": tag_map.get_single("note"),
+            "required": False,
+        },
+        {
+            "key": "topics",
+            "label": "Topics (comma-separated, optional)",
+            "default": _format_list_default(tag_map.get("t")),
+            "required": False,
+        },
+        {"key": "out_path", "label": "Export JSON path (optional)", "default": None, "required": False},
+    ]
+
+
+_TUI_STYLE_RULES = {
+    "output-area": "bg:#2b2b2b #e0e0e0",
+    "command-line": "bg:#3f3f3f #e0e0e0",
+    "prompt-line": "fg:#9ad1ff",
+    "section-line": "fg:#7fd1b9",
+    "error-line": "fg:#ff8a8a",
+    "input-area": "bg:#3f3f3f #e0e0e0",
+    "placeholder": "fg:#b0b0b0",
+    "completion-menu": "bg:#3a3a3a #e0e0e0",
+    "completion-menu.completion": "bg:#3a3a3a #e0e0e0",
+    "completion-menu.completion.current": "bg:#5a5a5a #e0e0e0",
+    "scrollbar.background": "bg:#3a3a3a",
+    "scrollbar.button": "bg:#5a5a5a",
+}
 
 
 def _interactive_tui() -> None:
     try:
         from prompt_toolkit.application import Application, run_in_terminal
         from prompt_toolkit.buffer import Buffer
+        from prompt_toolkit.filters import Always
         from prompt_toolkit.key_binding import KeyBindings
         from prompt_toolkit.layout import HSplit, Layout, Window
         from prompt_toolkit.layout.containers import VerticalAlign
@@ -3015,31 +3776,7 @@ def _interactive_tui() -> None:
         return
 
     separator_line = "-" * 72
-    command_meta = {
-        "/init-config": "Initialize default config in the database.",
-        "/edit-config": "Edit config stored in the database (prompted).",
-        "/create-ncc": "Create a draft NCC JSON file.",
-        "/create-nsr": "Create a draft succession record JSON file.",
-        "/create-endorsement": "Create a draft endorsement JSON file.",
-        "/revise-ncc": "Revise an existing NCC draft JSON file.",
-        "/revise-nsr": "Revise an existing succession record JSON file.",
-        "/revise-endorsement": "Revise an existing endorsement JSON file.",
-        "/list-ncc": "List NCC drafts in the database.",
-        "/list-nsr": "List succession record drafts in the database.",
-        "/list-endorsements": "List endorsement drafts in the database.",
-        "/publish-ncc": "Publish the latest NCC draft JSON file.",
-        "/publish-nsr": "Publish the latest succession record JSON file.",
-        "/publish-endorsement": "Publish the latest endorsement JSON file.",
-        "/verify-ncc": "Verify published NCC event id on relays.",
-        "/verify-nsr": "Verify published NSR event id on relays.",
-        "/verify-endorsement": "Verify published endorsement event id on relays.",
-        "/add-relay": "Add a relay to config.",
-        "/remove-relay": "Remove a relay from config.",
-        "/help": "Show available commands.",
-        "/quit": "Exit interactive mode.",
-    }
-    commands = list(command_meta)
-    completer = _CommandCompleter(commands, meta=command_meta)
+    completer = _CommandCompleter(_COMMANDS, meta=_COMMAND_META)
 
     class _OutputLexer(Lexer):
         def lex_document(self, document):
@@ -3072,11 +3809,24 @@ def _interactive_tui() -> None:
     app = None
 
     def append_line(text: str = "") -> None:
-        output_lines.append(text)
+        append_lines((text,))
+
+    def append_lines(lines: Iterable[str]) -> None:
+        # Setting the buffer text re-renders the whole log, so multi-line
+        # output such as listings is added in one go.
+        output_lines.extend(lines)
         output_buffer.text = "\n".join(output_lines)
         output_buffer.cursor_position = len(output_buffer.text)
         output_buffer.selection_state = None
 
+    def post_line(text: str = "") -> None:
+        # The publish worker runs on its own thread; hand its output to the
+        # event loop rather than touching the buffer directly.
+        if app is None or not app.is_running:
+            append_line(text)
+            return
+        app.loop.call_soon_threadsafe(append_line, text)
+
     def append_command(text: str) -> None:
         append_line("")
         append_line(f"> {text}")
@@ -3122,6 +3872,13 @@ def _interactive_tui() -> None:
         set_input_placeholder(step.get("default"))
         append_line(format_prompt(step["label"], step.get("default")))
 
+    def end_flow() -> None:
+        flow["steps"] = []
+        flow["on_complete"] = None
+        flow["mode"] = None
+        set_completer(True)
+        set_input_placeholder(None)
+
     def handle_flow_input(value: str) -> None:
         step = flow["steps"][flow["index"]]
         default = step.get("default")
@@ -3150,21 +3907,12 @@ def _interactive_tui() -> None:
             identifier = _format_ncc_identifier(value)
             if not identifier:
                 append_line("Cancelled.")
-                flow["steps"] = []
-                flow["on_complete"] = None
-                flow["mode"] = None
-                set_completer(True)
-                set_input_placeholder(None)
+                end_flow()
                 return
-            if flow.get("mode") == "revise-ncc":
-                kind = 30050
-            elif flow.get("mode") == "revise-nsr":
-                kind = 30051
-            else:
-                kind = 30052
+            kind = _FLOW_KINDS[flow["mode"]]
             config_path = _default_config_path()
             store = DraftStore(config_path)
-            draft = store.get_latest_draft(kind, identifier)
+            draft, tags = store.get_latest_draft_with_tags(kind, identifier)
             if not draft:
                 flow["steps"] = [
                     {
@@ -3186,154 +3934,14 @@ def _interactive_tui() -> None:
                 set_input_placeholder(step.get("default"))
                 append_line(format_prompt(step["label"], step.get("default")))
                 return
-            tags = store.get_tags(draft["id"])
             tag_map = _tags_to_map(tags)
             supersedes_default = list(tag_map.get("supersedes", []))
             if draft["event_id"]:
                 supersedes_default.append(f"event:{draft['event_id']}")
-            if kind == 30050:
-                steps = [
-                    {"key": "title", "label": "Title", "default": draft["title"], "required": True},
-                    {"key": "content_path", "label": "Content path", "default": None, "required": True},
-                    {"key": "open_editor", "label": "Open editor now? (y/n)", "default": "y", "required": False},
-                    {
-                        "key": "summary",
-                        "label": "Summary (optional)",
-                        "default": tag_map.get("summary", [None])[0],
-                        "required": False,
-                    },
-                    {
-                        "key": "topics",
-                        "label": "Topics (comma-separated, optional)",
-                        "default": _format_list_default(tag_map.get("t")),
-                        "required": False,
-                    },
-                    {"key": "lang", "label": "Lang (optional)", "default": tag_map.get("lang", [None])[0], "required": False},
-                    {
-                        "key": "version",
-                        "label": "Version (optional)",
-                        "default": tag_map.get("version", [None])[0],
-                        "required": False,
-                    },
-                    {
-                        "key": "supersedes",
-                        "label": "Supersedes (event id, optional)",
-                        "default": _format_list_default(supersedes_default),
-                        "required": False,
-                    },
-                    {
-                        "key": "license",
-                        "label": "License (optional)",
-                        "default": tag_map.get("license", [None])[0],
-                        "required": False,
-                    },
-                    {
-                        "key": "authors",
-                        "label": "Authors (npub or hex pubkey; comma-separated, optional)",
-                        "default": _format_list_default(tag_map.get("authors")),
-                        "required": False,
-                    },
-                    {"key": "out_path", "label": "Export JSON path (optional)", "default": None, "required": False},
-                ]
-                restart_flow(
-                    steps,
-                    flow["on_complete"],
-                    "revise-ncc-edit",
-                    {
-                        "d": identifier,
-                        "draft_id": draft["id"],
-                        "content_seed": draft["content"] or "",
-                        "config_path": config_path,
-                    },
-                )
-                return
-            if kind == 30051:
-                steps = [
-                    {
-                        "key": "authoritative_event",
-                        "label": "Authoritative event id",
-                        "default": _strip_event_prefix(tag_map.get("authoritative", [None])[0]),
-                        "required": True,
-                    },
-                    {"key": "content_path", "label": "Content path", "default": None, "required": True},
-                    {"key": "open_editor", "label": "Open editor now? (y/n)", "default": "y", "required": False},
-                    {
-                        "key": "steward",
-                        "label": "Steward (optional)",
-                        "default": tag_map.get("steward", [None])[0],
-                        "required": False,
-                    },
-                    {
-                        "key": "previous",
-                        "label": "Previous event id (optional)",
-                        "default": _strip_event_prefix(tag_map.get("previous", [None])[0]),
-                        "required": False,
-                    },
-                    {
-                        "key": "reason",
-                        "label": "Reason (optional)",
-                        "default": tag_map.get("reason", [None])[0],
-                        "required": False,
-                    },
-                    {
-                        "key": "effective_at",
-                        "label": "Effective at (optional)",
-                        "default": tag_map.get("effective_at", [None])[0],
-                        "required": False,
-                    },
-                    {"key": "out_path", "label": "Export JSON path (optional)", "default": None, "required": False},
-                ]
-                restart_flow(
-                    steps,
-                    flow["on_complete"],
-                    "revise-nsr-edit",
-                    {
-                        "d": identifier,
-                        "draft_id": draft["id"],
-                        "content_seed": draft["content"] or "",
-                        "config_path": config_path,
-                    },
-                )
-                return
-            steps = [
-                {
-                    "key": "endorses_event",
-                    "label": "Endorses event id",
-                    "default": _strip_event_prefix(tag_map.get("endorses", [None])[0]),
-                    "required": True,
-                },
-                {"key": "content_path", "label": "Content path", "default": None, "required": True},
-                {"key": "open_editor", "label": "Open editor now? (y/n)", "default": "y", "required": False},
-                {
-                    "key": "roles",
-                    "label": "Role (author/client/user, comma-separated, optional)",
-                    "default": _format_list_default(tag_map.get("role")),
-                    "required": False,
-                },
-                {
-                    "key": "implementation",
-                    "label": "Implementation (optional)",
-                    "default": tag_map.get("implementation", [None])[0],
-                    "required": False,
-                },
-                {
-                    "key": "note",
-                    "label": "Note (optional)",
-                    "default": tag_map.get("note", [None])[0],
-                    "required": False,
-                },
-                {
-                    "key": "topics",
-                    "label": "Topics (comma-separated, optional)",
-                    "default": _format_list_default(tag_map.get("t")),
-                    "required": False,
-                },
-                {"key": "out_path", "label": "Export JSON path (optional)", "default": None, "required": False},
-            ]
             restart_flow(
-                steps,
+                _revise_flow_steps(kind, tag_map, title=draft["title"], supersedes=supersedes_default),
                 flow["on_complete"],
-                "revise-endorsement-edit",
+                _REVISE_EDIT_MODES[kind],
                 {
                     "d": identifier,
                     "draft_id": draft["id"],
@@ -3341,23 +3949,19 @@ def _interactive_tui() -> None:
                     "config_path": config_path,
                 },
             )
+            if kind != 30052:
+                return
             published = _get_published_ncc_events(config_path, identifier)
             if published:
                 append_line("Published NCC events:")
-                for line in _format_published_ncc_event_choices(published):
-                    append_line(line)
+                append_lines(_format_published_ncc_event_choices(published))
                 set_custom_completer(_published_ncc_event_completer(published))
             else:
                 append_line("No published NCC events found for that identifier.")
                 set_custom_completer(None)
             return
         if flow.get("mode") in ("publish-ncc", "publish-nsr", "publish-endorsement") and step.get("key") == "d":
-            if flow.get("mode") == "publish-ncc":
-                kind = 30050
-            elif flow.get("mode") == "publish-nsr":
-                kind = 30051
-            else:
-                kind = 30052
+            kind = _FLOW_KINDS[flow["mode"]]
             config_path = _default_config_path()
             store = DraftStore(config_path)
             draft = None
@@ -3375,11 +3979,7 @@ def _interactive_tui() -> None:
                 identifier = _format_ncc_identifier(value)
                 if not identifier:
                     append_line("Cancelled.")
-                    flow["steps"] = []
-                    flow["on_complete"] = None
-                    flow["mode"] = None
-                    set_completer(True)
-                    set_input_placeholder(None)
+                    end_flow()
                     return
                 draft = store.get_latest_draft(kind, identifier)
             if not draft:
@@ -3429,19 +4029,10 @@ def _interactive_tui() -> None:
         if flow.get("mode") in ("revise-ncc-path", "revise-nsr-path", "revise-endorsement-path") and step.get("key") == "json_path":
             if not value:
                 append_line("Cancelled.")
-                flow["steps"] = []
-                flow["on_complete"] = None
-                flow["mode"] = None
-                set_completer(True)
-                set_input_placeholder(None)
+                end_flow()
                 return
             payload = _load_json(value)
-            if flow.get("mode") == "revise-ncc-path":
-                kind = 30050
-            elif flow.get("mode") == "revise-nsr-path":
-                kind = 30051
-            else:
-                kind = 30052
+            kind = _FLOW_KINDS[flow["mode"]]
             identifier = flow["answers"].get("d") or ""
             tags = _tags_from_payload(payload)
             title = None
@@ -3458,149 +4049,10 @@ def _interactive_tui() -> None:
                 tags=tags,
             )
             tag_map = _tags_to_map(tags)
-            if kind == 30050:
-                steps = [
-                    {"key": "title", "label": "Title", "default": title, "required": True},
-                    {"key": "content_path", "label": "Content path", "default": None, "required": True},
-                    {"key": "open_editor", "label": "Open editor now? (y/n)", "default": "y", "required": False},
-                    {
-                        "key": "summary",
-                        "label": "Summary (optional)",
-                        "default": tag_map.get("summary", [None])[0],
-                        "required": False,
-                    },
-                    {
-                        "key": "topics",
-                        "label": "Topics (comma-separated, optional)",
-                        "default": _format_list_default(tag_map.get("t")),
-                        "required": False,
-                    },
-                    {"key": "lang", "label": "Lang (optional)", "default": tag_map.get("lang", [None])[0], "required": False},
-                    {
-                        "key": "version",
-                        "label": "Version (optional)",
-                        "default": tag_map.get("version", [None])[0],
-                        "required": False,
-                    },
-                    {
-                        "key": "supersedes",
-                        "label": "Supersedes (event id, optional)",
-                        "default": _format_list_default(tag_map.get("supersedes")),
-                        "required": False,
-                    },
-                    {
-                        "key": "license",
-                        "label": "License (optional)",
-                        "default": tag_map.get("license", [None])[0],
-                        "required": False,
-                    },
-                    {
-                        "key": "authors",
-                        "label": "Authors (npub or hex pubkey; comma-separated, optional)",
-                        "default": _format_list_default(tag_map.get("authors")),
-                        "required": False,
-                    },
-                    {"key": "out_path", "label": "Export JSON path (optional)", "default": None, "required": False},
-                ]
-                restart_flow(
-                    steps,
-                    flow["on_complete"],
-                    "revise-ncc-edit",
-                    {
-                        "d": identifier,
-                        "draft_id": draft_id,
-                        "content_seed": content,
-                        "config_path": config_path,
-                    },
-                )
-                return
-            if kind == 30051:
-                steps = [
-                    {
-                        "key": "authoritative_event",
-                        "label": "Authoritative event id",
-                        "default": _strip_event_prefix(tag_map.get("authoritative", [None])[0]),
-                        "required": True,
-                    },
-                    {"key": "content_path", "label": "Content path", "default": None, "required": True},
-                    {"key": "open_editor", "label": "Open editor now? (y/n)", "default": "y", "required": False},
-                    {
-                        "key": "steward",
-                        "label": "Steward (optional)",
-                        "default": tag_map.get("steward", [None])[0],
-                        "required": False,
-                    },
-                    {
-                        "key": "previous",
-                        "label": "Previous event id (optional)",
-                        "default": _strip_event_prefix(tag_map.get("previous", [None])[0]),
-                        "required": False,
-                    },
-                    {
-                        "key": "reason",
-                        "label": "Reason (optional)",
-                        "default": tag_map.get("reason", [None])[0],
-                        "required": False,
-                    },
-                    {
-                        "key": "effective_at",
-                        "label": "Effective at (optional)",
-                        "default": tag_map.get("effective_at", [None])[0],
-                        "required": False,
-                    },
-                    {"key": "out_path", "label": "Export JSON path (optional)", "default": None, "required": False},
-                ]
-                restart_flow(
-                    steps,
-                    flow["on_complete"],
-                    "revise-nsr-edit",
-                    {
-                        "d": identifier,
-                        "draft_id": draft_id,
-                        "content_seed": content,
-                        "config_path": config_path,
-                    },
-                )
-                return
-            steps = [
-                {
-                    "key": "endorses_event",
-                    "label": "Endorses event id",
-                    "default": _strip_event_prefix(tag_map.get("endorses", [None])[0]),
-                    "required": True,
-                },
-                {"key": "content_path", "label": "Content path", "default": None, "required": True},
-                {"key": "open_editor", "label": "Open editor now? (y/n)", "default": "y", "required": False},
-                {
-                    "key": "roles",
-                    "label": "Role (author/client/user, comma-separated, optional)",
-                    "default": _format_list_default(tag_map.get("role")),
-                    "required": False,
-                },
-                {
-                    "key": "implementation",
-                    "label": "Implementation (optional)",
-                    "default": tag_map.get("implementation", [None])[0],
-                    "required": False,
-                },
-                {
-                    "key": "note",
-                    "label": "Note (optional)",
-                    "default": tag_map.get("note", [None])[0],
-                    "required": False,
-                },
-                {
-                    "key": "topics",
-                    "label": "Topics (comma-separated, optional)",
-                    "default": _format_list_default(tag_map.get("t")),
-                    "required": False,
-                },
-                {"key": "out_path", "label": "Export JSON path (optional)", "default": None, "required": False},
-            ]
             restart_flow(
-                steps,
+                _revise_flow_steps(kind, tag_map, title=title, supersedes=list(tag_map.get("supersedes", []))),
                 flow["on_complete"],
-                "revise-endorsement-edit",
+                _REVISE_EDIT_MODES[kind],
                 {
                     "d": identifier,
                     "draft_id": draft_id,
@@ -3608,11 +4060,12 @@ def _interactive_tui() -> None:
                     "config_path": config_path,
                 },
             )
+            if kind != 30052:
+                return
             published = _get_published_ncc_events(config_path, identifier)
             if published:
                 append_line("Published NCC events:")
-                for line in _format_published_ncc_event_choices(published):
-                    append_line(line)
+                append_lines(_format_published_ncc_event_choices(published))
                 set_custom_completer(_published_ncc_event_completer(published))
             else:
                 append_line("No published NCC events found for that identifier.")
@@ -3621,22 +4074,11 @@ def _interactive_tui() -> None:
         if flow.get("mode") in ("publish-ncc-path", "publish-nsr-path", "publish-endorsement-path") and step.get("key") == "json_path":
             if not value:
                 append_line("Cancelled.")
-                flow["steps"] = []
-                flow["on_complete"] = None
-                flow["mode"] = None
-                set_completer(True)
-                set_input_placeholder(None)
+                end_flow()
                 return
             flow["answers"]["json_path"] = value
-            if flow.get("mode") == "publish-ncc-path":
-                kind = 30050
-                flow_mode = "publish-ncc"
-            elif flow.get("mode") == "publish-nsr-path":
-                kind = 30051
-                flow_mode = "publish-nsr"
-            else:
-                kind = 30052
-                flow_mode = "publish-endorsement"
+            kind = _FLOW_KINDS[flow["mode"]]
+            flow_mode = flow["mode"][: -len("-path")]
             config_defaults = _load_config_db(_default_config_path())
             restart_flow(
                 [
@@ -3680,10 +4122,13 @@ def _interactive_tui() -> None:
                     if draft and draft["content"] is not None:
                         seed = draft["content"]
                         flow["answers"]["content_seed"] = seed
+            if seed is None and not os.path.exists(content_path):
+                seed = _ncc_template_content(flow["answers"].get("title"))
             if seed is not None:
                 _write_text_file(content_path, seed)
-            elif not os.path.exists(content_path):
-                _write_text_file(content_path, _ncc_template_content())
+                flow["answers"]["content"] = seed
+            else:
+                flow["answers"].pop("content", None)
             flow["answers"]["content_path"] = content_path
         if step.get("key") == "open_editor":
             open_now = _is_truthy_response(value) if value else True
@@ -3691,7 +4136,8 @@ def _interactive_tui() -> None:
             if open_now and content_path:
                 append_line("Opening editor...")
                 run_editor(content_path)
-            if content_path:
+                flow["answers"].pop("content", None)
+            if content_path and "content" not in flow["answers"]:
                 flow["answers"]["content"] = _load_content_from_path(content_path)
         if step.get("key") == "config_path":
             config = _load_config_db(value) if value else {}
@@ -3714,11 +4160,7 @@ def _interactive_tui() -> None:
         flow["index"] += 1
         if flow["index"] >= len(flow["steps"]):
             on_complete = flow["on_complete"]
-            flow["steps"] = []
-            flow["on_complete"] = None
-            flow["mode"] = None
-            set_completer(True)
-            set_input_placeholder(None)
+            end_flow()
             if on_complete:
                 on_complete(flow["answers"])
             return
@@ -3728,8 +4170,7 @@ def _interactive_tui() -> None:
             published = _get_published_ncc_events(_default_config_path(), identifier) if identifier else []
             if published:
                 append_line("Published NCC events:")
-                for line in _format_published_ncc_event_choices(published):
-                    append_line(line)
+                append_lines(_format_published_ncc_event_choices(published))
                 set_custom_completer(_published_ncc_event_completer(published))
             else:
                 append_line("No published NCC events found for that identifier.")
@@ -3762,55 +4203,7 @@ def _interactive_tui() -> None:
             return
 
         if command in ("/help", "?"):
-            append_line("Commands:")
-            append_line("  /init-config")
-            append_line("  /edit-config")
-            append_line("  /create-ncc")
-            append_line("  /create-nsr")
-            append_line("  /create-endorsement")
-            append_line("  /revise-ncc")
-            append_line("  /revise-nsr")
-            append_line("  /revise-endorsement")
-            append_line("  /list-ncc")
-            append_line("  /list-nsr")
-            append_line("  /list-endorsements")
-            append_line("  /publish-ncc")
-            append_line("  /publish-nsr")
-            append_line("  /publish-endorsement")
-            append_line("  /verify-ncc")
-            append_line("  /verify-nsr")
-            append_line("  /verify-endorsement")
-            append_line("  /add-relay")
-            append_line("  /remove-relay")
-            append_line("  /quit")
-            append_line("")
-            append_line("Details:")
-            append_line("  /init-config  Initialize default config in the database.")
-            append_line("  /edit-config  Edit config stored in the database (prompted).")
-            append_line("  /create-ncc   Create a draft NCC JSON file.")
-            append_line("  /create-nsr   Create a draft succession record JSON file.")
-            append_line("  /create-endorsement   Create a draft endorsement JSON file.")
-            append_line("  /revise-ncc   Revise an existing NCC draft JSON file.")
-            append_line("  /revise-nsr   Revise an existing succession record JSON file.")
-            append_line("  /revise-endorsement   Revise an existing endorsement JSON file.")
-            append_line("  /list-ncc     List NCC drafts in the database.")
-            append_line("  /list-nsr     List succession record drafts in the database.")
-            append_line("  /list-endorsements     List endorsement drafts in the database.")
-            append_line("  /publish-ncc  Publish the latest NCC draft JSON file.")
-            append_line("  /publish-nsr  Publish the latest succession record JSON file.")
-            append_line("  /publish-endorsement  Publish the latest endorsement JSON file.")
-            append_line("  /verify-ncc   Verify published NCC event id on relays.")
-            append_line("  /verify-nsr   Verify published NSR event id on relays.")
-            append_line("  /verify-endorsement   Verify published endorsement event id on relays.")
-            append_line("  /add-relay    Add a relay to config.")
-            append_line("  /remove-relay Remove a relay from config.")
-            append_line("  /quit         Exit interactive mode.")
-            append_line("")
-            append_line("Getting started:")
-            append_line("  1) /init-config")
-            append_line("  2) /edit-config")
-            append_line("  3) /create-ncc")
-            append_line("  4) /publish-ncc")
+            append_line(_HELP_TEXT)
             return
 
         if not command.startswith("/"):
@@ -3914,15 +4307,16 @@ def _interactive_tui() -> None:
             ]
 
             def _complete_edit(answers: dict) -> None:
+                # Values kept from the stored config were validated when saved.
                 privkey = answers.get("privkey") or ""
-                if privkey:
+                if privkey and privkey != (config.get("privkey") if isinstance(config, dict) else None):
                     try:
-                        Keys.parse(privkey)
+                        _parse_keys(privkey)
                     except Exception:
                         append_line("Error: privkey must be nsec or hex.")
                         return
                 authors = _normalize_list(answers.get("authors"))
-                if authors:
+                if authors and authors != config_tags.get("authors"):
                     try:
                         authors = _validate_author_keys(authors)
                     except ValueError as exc:
@@ -3945,6 +4339,9 @@ def _interactive_tui() -> None:
                         "effective_at": _normalize_optional_str(answers.get("effective_at")) or "",
                     },
                 }
+                if updated == config:
+                    append_line("Config unchanged.")
+                    return
                 _write_config_db(config_path, updated)
                 append_line(f"Updated config in database at {config_path}")
 
@@ -3961,8 +4358,8 @@ def _interactive_tui() -> None:
                 if content_path and os.path.exists(content_path):
                     content = _load_content_from_path(content_path)
                 else:
-                    content = answers.get("content") or _ncc_template_content()
-                content = content.replace("# Title", f"# {answers['title']}", 1)
+                    content = answers.get("content") or _ncc_template_content(answers["title"])
+                content = _apply_title_heading(content, answers["title"])
                 summary = _normalize_optional_str(answers.get("summary")) or config_tags.get("summary")
                 lang = _normalize_optional_str(answers.get("lang")) or config_tags.get("lang")
                 version = _normalize_optional_str(answers.get("version")) or config_tags.get("version")
@@ -4059,8 +4456,8 @@ def _interactive_tui() -> None:
                 if content_path and os.path.exists(content_path):
                     content = _load_content_from_path(content_path)
                 else:
-                    content = answers.get("content") or _ncc_template_content()
-                content = content.replace("# Title", f"# {answers['title']}", 1)
+                    content = answers.get("content") or _ncc_template_content(answers["title"])
+                content = _apply_title_heading(content, answers["title"])
                 try:
                     authors = _validate_author_keys(_parse_list_value(answers.get("authors") or ""))
                 except ValueError as exc:
@@ -4314,12 +4711,7 @@ def _interactive_tui() -> None:
             return
 
         if command in ("/list-ncc", "/list-nsr", "/list-endorsements"):
-            if command == "/list-ncc":
-                kind = 30050
-            elif command == "/list-nsr":
-                kind = 30051
-            else:
-                kind = 30052
+            kind = _COMMAND_KINDS[command]
             config_path = _default_config_path()
             def _render_list() -> None:
                 store = DraftStore(config_path)
@@ -4341,18 +4733,20 @@ def _interactive_tui() -> None:
                     privkey = config.get("privkey") if isinstance(config, dict) else None
                     if privkey:
                         try:
-                            pubkey_hex = Keys.parse(privkey).public_key().to_hex()
+                            pubkey_hex = _parse_keys(privkey).public_key().to_hex()
                         except Exception:
                             pubkey_hex = None
                     local_identifiers, local_event_ids = _get_local_ncc_targets(config_path, pubkey_hex)
+                tags_by_draft = store.get_tags_by_draft(kind) if kind != 30051 else {}
+                lines = []
                 for row in rows:
                     title = row["title"] or "-"
-                    updated_at = _format_ts(row["updated_at"])
+                    updated_at = row["updated_fmt"]
                     status = row["status"] or "draft"
-                    published_at = _format_ts(row["published_at"])
+                    published_at = row["published_fmt"]
                     event_id = row["event_id"] or "-"
                     if kind == 30050:
-                        tags = store.get_tags(row["id"])
+                        tags = tags_by_draft.get(row["id"], [])
                         labels = _classify_ncc_row(
                             row,
                             tags,
@@ -4362,19 +4756,20 @@ def _interactive_tui() -> None:
                         )
                         label_text = ", ".join(labels)
                         endorsement_count = endorsement_counts.get(row["event_id"] or "", 0)
-                        append_line(
+                        lines.append(
                             f"  #{row['id']} {row['d']} {title} | {status} | {label_text} | endorsements {endorsement_count} | updated {updated_at} | published {published_at} | event {event_id}"
                         )
                     elif kind == 30051:
-                        append_line(
+                        lines.append(
                             f"  #{row['id']} {row['d']} {title} | {status} | updated {updated_at} | published {published_at} | event {event_id}"
                         )
                     else:
-                        tags = store.get_tags(row["id"])
+                        tags = tags_by_draft.get(row["id"], [])
                         endorses = _extract_endorsement_fields_from_tags(tags)[0] or "-"
-                        append_line(
+                        lines.append(
                             f"  #{row['id']} {row['d']} endorses {endorses} | {status} | updated {updated_at} | published {published_at} | event {event_id}"
                         )
+                append_lines(lines)
 
             if kind == 30050:
                 def _complete_fetch(answers: dict) -> None:
@@ -4424,12 +4819,7 @@ def _interactive_tui() -> None:
             return
 
         if command in ("/publish-ncc", "/publish-nsr", "/publish-endorsement"):
-            if command == "/publish-ncc":
-                publish_kind = 30050
-            elif command == "/publish-nsr":
-                publish_kind = 30051
-            else:
-                publish_kind = 30052
+            publish_kind = _COMMAND_KINDS[command]
 
             def _complete_publish_latest(answers: dict) -> None:
                 config_path = _default_config_path()
@@ -4443,7 +4833,7 @@ def _interactive_tui() -> None:
                 if not privkey:
                     append_line("Error: privkey is required.")
                     return
-                keys = Keys.parse(privkey)
+                keys = _parse_keys(privkey)
                 kind = publish_kind
                 succession_info: Optional[tuple[str, Optional[str], Optional[str]]] = None
                 draft_id = answers.get("draft_id")
@@ -4477,29 +4867,20 @@ def _interactive_tui() -> None:
                         except ValueError as exc:
                             append_line(f"Error: {exc}")
                             return
-                    append_line("Publishing event...")
-                    try:
-                        with _PUBLISH_LOCK:
-                            event_id = service.publish_draft(int(draft_id), relays=relays, keys=keys)
-                    except Exception as exc:
-                        service.enqueue_task(
-                            {
-                                "type": "draft",
-                                "config_path": config_path,
-                                "draft_id": int(draft_id),
-                                "relays": relays,
-                            }
-                        )
-                        append_line(f"Publish failed: {exc}. Queued for retry.")
-                    if kind == 30051 and succession_info:
-                        authoritative, previous, steward = succession_info
-                        _apply_succession_updates(
-                            config_path=config_path,
-                            authoritative_event=authoritative,
-                            previous_event=previous,
-                            steward=steward,
-                            succession_event_id=event_id,
-                        )
+                    _submit_publish_task(
+                        service,
+                        {
+                            "type": "draft",
+                            "config_path": config_path,
+                            "draft_id": int(draft_id),
+                            "relays": relays,
+                            "next_attempt_at": _now(),
+                        },
+                        privkey=privkey,
+                        keys=keys,
+                        output=post_line,
+                        background=True,
+                    )
                     return
                 json_path = answers.get("json_path")
                 if not json_path:
@@ -4536,30 +4917,20 @@ def _interactive_tui() -> None:
                     except ValueError as exc:
                         append_line(f"Error: {exc}")
                         return
-                append_line("Publishing event...")
-                try:
-                    with _PUBLISH_LOCK:
-                        event_id = service.publish_json(json_path, relays=relays, keys=keys)
-                except Exception as exc:
-                    service.enqueue_task(
-                        {
-                            "type": "json",
-                            "config_path": config_path,
-                            "json_path": json_path,
-                            "relays": relays,
-                        }
-                    )
-                    append_line(f"Publish failed: {exc}. Queued for retry.")
-                    return
-                if kind == 30051 and succession_info:
-                    authoritative, previous, steward = succession_info
-                    _apply_succession_updates(
-                        config_path=config_path,
-                        authoritative_event=authoritative,
-                        previous_event=previous,
-                        steward=steward,
-                        succession_event_id=event_id,
-                    )
+                _submit_publish_task(
+                    service,
+                    {
+                        "type": "json",
+                        "config_path": config_path,
+                        "json_path": json_path,
+                        "relays": relays,
+                        "next_attempt_at": _now(),
+                    },
+                    privkey=privkey,
+                    keys=keys,
+                    output=post_line,
+                    background=True,
+                )
 
             store = DraftStore(_default_config_path())
             unpublished = store.list_unpublished_drafts(publish_kind)
@@ -4573,8 +4944,7 @@ def _interactive_tui() -> None:
             if not unpublished:
                 append_line("  (none)")
             else:
-                for line in _format_unpublished_drafts(unpublished):
-                    append_line(line)
+                append_lines(_format_unpublished_drafts(unpublished))
             draft_options: List[str] = []
             draft_meta: Dict[str, str] = {}
             for row in unpublished:
@@ -4601,12 +4971,7 @@ def _interactive_tui() -> None:
             return
 
         if command in ("/verify-ncc", "/verify-nsr", "/verify-endorsement"):
-            if command == "/verify-ncc":
-                kind = 30050
-            elif command == "/verify-nsr":
-                kind = 30051
-            else:
-                kind = 30052
+            kind = _COMMAND_KINDS[command]
             config_path = _default_config_path()
             store = DraftStore(config_path)
             config = store.load_config()
@@ -4621,8 +4986,7 @@ def _interactive_tui() -> None:
             if not published:
                 append_line("  (none)")
                 return
-            for line in _format_published_drafts(published):
-                append_line(line)
+            append_lines(_format_published_drafts(published))
             verify_options: List[str] = []
             verify_meta: Dict[str, str] = {}
             for row in published:
@@ -4732,8 +5096,7 @@ def _interactive_tui() -> None:
             if not relays:
                 append_line("  (none)")
                 return
-            for line in _format_relay_list(relays):
-                append_line(line)
+            append_lines(_format_relay_list(relays))
             relay_meta: Dict[str, str] = {}
             relay_options: List[str] = []
             for idx, relay in enumerate(relays, start=1):
@@ -4788,7 +5151,7 @@ def _interactive_tui() -> None:
     )
     input_field = TextArea(height=1, prompt="› ", multiline=False)
     input_field.buffer.completer = completer
-    input_field.buffer.complete_while_typing = lambda: True
+    input_field.buffer.complete_while_typing = Always()
     base_placeholder = "Find and fix a bug in @filename"
 
     def set_input_placeholder(value: Optional[str]) -> None:
@@ -4864,33 +5227,21 @@ def _interactive_tui() -> None:
     def _complete_next(event) -> None:
         event.app.current_buffer.complete_next()
 
-    style = Style.from_dict(
-        {
-            "output-area": "bg:#2b2b2b #e0e0e0",
-            "command-line": "bg:#3f3f3f #e0e0e0",
-            "prompt-line": "fg:#9ad1ff",
-            "section-line": "fg:#7fd1b9",
-            "error-line": "fg:#ff8a8a",
-            "input-area": "bg:#3f3f3f #e0e0e0",
-            "placeholder": "fg:#b0b0b0",
-            "completion-menu": "bg:#3a3a3a #e0e0e0",
-            "completion-menu.completion": "bg:#3a3a3a #e0e0e0",
-            "completion-menu.completion.current": "bg:#5a5a5a #e0e0e0",
-            "scrollbar.background": "bg:#3a3a3a",
-            "scrollbar.button": "bg:#5a5a5a",
-        }
-    )
+    style = Style.from_dict(_TUI_STYLE_RULES)
     app = Application(layout=layout, key_bindings=kb, full_screen=True, style=style)
 
     append_line("NCC publisher")
     append_line("Type /help for commands.")
     append_line("")
     append_line(separator_line)
-    _start_publish_queue_worker()
+    _start_publish_queue_worker(post_line)
     app.run()
 
 
 def _interactive() -> None:
+    if not sys.stdin.isatty():
+        _interactive_cli()
+        return
     try:
         import prompt_toolkit  # noqa: F401
     except Exception:
@@ -4900,6 +5251,7 @@ def _interactive() -> None:
 
 
 def _set_builder_created_at(builder: EventBuilder, created_at: Optional[int]) -> EventBuilder:
+    from nostr_sdk import Timestamp
     if created_at is None:
         return builder
     timestamp = Timestamp.from_secs(int(created_at))
@@ -4918,38 +5270,62 @@ def _merge_optional_list(value: Optional[List[str]], fallback: Optional[List[str
     return fallback
 
 
-def _ncc_template_content() -> str:
-    return (
-        "# Title\n\n"
-        "**Status:** Draft\n\n"
-        "## Scope\n"
-        "- What the convention applies to\n"
-        "- What the convention does not cover\n\n"
-        "## Standards or NIPs referenced\n"
-        "- List any related NIPs\n\n"
-        "## Overview\n"
-        "- Problem statement and intent\n\n"
-        "## Design principles\n"
-        "- Constraints or values guiding the convention\n\n"
-        "## Core approach\n"
-        "- Behavioural or structural model being proposed\n\n"
-        "## Event schema\n"
-        "- Required fields/tags\n"
-        "- Optional fields/tags\n\n"
-        "## Examples\n"
-        "- Representative examples\n\n"
-        "## Client behaviour guidance\n"
-        "- Expected handling by supporting clients\n\n"
-        "## Privacy and security considerations\n"
-        "- Metadata that remains visible\n"
-        "- Metadata that does not\n\n"
-        "## Non-goals\n"
-        "- Explicit exclusions to prevent scope creep\n\n"
-        "## FAQ or rationale\n"
-        "- Optional clarifications\n\n"
-        "## Status and next steps\n"
-        "- Adoption expectations and future formalisation notes\n"
-    )
+# Prompt answers fall back to config defaults; an empty answer returns the
+# default without going through the normalizers.
+def _pick_optional(value: Optional[str], fallback: Optional[str]) -> Optional[str]:
+    if not value:
+        return fallback
+    return value.strip() or fallback
+
+
+def _pick_list(value: Optional[str], fallback: Optional[List[str]]) -> List[str]:
+    if not value:
+        return fallback or []
+    return _parse_list_value(value) or fallback or []
+
+
+_NCC_TEMPLATE_BODY = (
+    "**Status:** Draft\n\n"
+    "## Scope\n"
+    "- What the convention applies to\n"
+    "- What the convention does not cover\n\n"
+    "## Standards or NIPs referenced\n"
+    "- List any related NIPs\n\n"
+    "## Overview\n"
+    "- Problem statement and intent\n\n"
+    "## Design principles\n"
+    "- Constraints or values guiding the convention\n\n"
+    "## Core approach\n"
+    "- Behavioural or structural model being proposed\n\n"
+    "## Event schema\n"
+    "- Required fields/tags\n"
+    "- Optional fields/tags\n\n"
+    "## Examples\n"
+    "- Representative examples\n\n"
+    "## Client behaviour guidance\n"
+    "- Expected handling by supporting clients\n\n"
+    "## Privacy and security considerations\n"
+    "- Metadata that remains visible\n"
+    "- Metadata that does not\n\n"
+    "## Non-goals\n"
+    "- Explicit exclusions to prevent scope creep\n\n"
+    "## FAQ or rationale\n"
+    "- Optional clarifications\n\n"
+    "## Status and next steps\n"
+    "- Adoption expectations and future formalisation notes\n"
+)
+
+
+def _ncc_template_content(title: Optional[str] = None) -> str:
+    return f"# {title or 'Title'}\n\n" + _NCC_TEMPLATE_BODY
+
+
+def _apply_title_heading(content: str, title: str) -> str:
+    # Only the template's placeholder heading on the first line is replaced.
+    head, sep, rest = content.partition("\n")
+    if head != "# Title":
+        return content
+    return f"# {title}{sep}{rest}"
 
 
 def build_document_json(
@@ -5053,20 +5429,22 @@ def build_document_event(
     license_id: Optional[str],
     authors: Optional[List[str]],
 ) -> EventBuilder:
-    tags = _ncc_tags_from_inputs(
-        summary=summary,
-        topics=topics or [],
-        lang=lang,
-        version=version,
-        supersedes=supersedes or [],
-        license_id=license_id,
-        authors=authors or [],
-        published_at=published_at,
+    return _builder_from_payload(
+        build_document_json(
+            d=d,
+            title=title,
+            content=content,
+            published_at=published_at,
+            summary=summary,
+            topics=topics,
+            lang=lang,
+            version=version,
+            supersedes=supersedes,
+            license_id=license_id,
+            authors=authors,
+        )
     )
 
-    builder = EventBuilder(Kind(30050), content).tags(_event_tags_from_tuples(30050, d, title, tags))
-    return _set_builder_created_at(builder, published_at)
-
 
 def build_succession_event(
     *,
@@ -5079,17 +5457,19 @@ def build_succession_event(
     reason: Optional[str],
     effective_at: Optional[int],
 ) -> EventBuilder:
-    tags = _nsr_tags_from_inputs(
-        authoritative_event=authoritative_event,
-        steward=steward,
-        previous=previous,
-        reason=reason,
-        effective_at=str(effective_at) if effective_at else None,
+    return _builder_from_payload(
+        build_succession_json(
+            d=d,
+            authoritative_event=authoritative_event,
+            content=content,
+            created_at=created_at,
+            steward=steward,
+            previous=previous,
+            reason=reason,
+            effective_at=effective_at,
+        )
     )
 
-    builder = EventBuilder(Kind(30051), content).tags(_event_tags_from_tuples(30051, d, None, tags))
-    return _set_builder_created_at(builder, created_at)
-
 
 def build_endorsement_event(
     *,
@@ -5102,29 +5482,31 @@ def build_endorsement_event(
     note: Optional[str],
     topics: Optional[List[str]],
 ) -> EventBuilder:
-    tags = _endorsement_tags_from_inputs(
-        endorses_event=endorses_event,
-        roles=roles,
-        implementation=implementation,
-        note=note,
-        topics=topics or [],
+    return _builder_from_payload(
+        build_endorsement_json(
+            d=d,
+            endorses_event=endorses_event,
+            content=content,
+            created_at=created_at,
+            roles=roles,
+            implementation=implementation,
+            note=note,
+            topics=topics,
+        )
     )
 
-    builder = EventBuilder(Kind(30052), content).tags(_event_tags_from_tuples(30052, d, None, tags))
-    return _set_builder_created_at(builder, created_at)
-
 
 async def publish_event(builder: EventBuilder, *, relays: List[str], keys: Keys) -> str:
+    from nostr_sdk import EventId, Filter
     if not relays:
-        raise SystemExit("At least one --relay is required to publish.")
-    signer = NostrSigner.keys(keys)
-    client = Client(signer)
-    for relay in relays:
-        await client.add_relay(RelayUrl.parse(relay))
-    await client.connect()
-
-    event = await client.sign_event_builder(builder)
-    await client.send_event(event)
+        raise ValueError("At least one --relay is required to publish.")
+    client = await _get_client(relays, keys)
+    try:
+        event = await client.sign_event_builder(builder)
+        await client.send_event(event)
+    except Exception:
+        await _discard_client(relays, keys)
+        raise
 
     event_id = event.id().to_hex()
     try:
@@ -5138,7 +5520,6 @@ async def publish_event(builder: EventBuilder, *, relays: List[str], keys: Keys)
             print(f"Warning: event not found on relays yet: {event_id}")
     except Exception as exc:
         print(f"Warning: could not verify event on relays: {exc}")
-    await client.disconnect()
     print(f"Published event kind={event.kind()} id={event_id}")
     return event_id
 
@@ -5152,15 +5533,12 @@ def build_event_from_json(payload: dict) -> EventBuilder:
     tags_value = payload.get("tags", [])
     if not isinstance(tags_value, list):
         raise SystemExit("JSON field tags must be a list")
+    if not all(isinstance(tag, list) for tag in tags_value):
+        raise SystemExit("Each tag must be a list")
 
-    tags: List[Tag] = []
-    for tag in tags_value:
-        if not isinstance(tag, list):
-            raise SystemExit("Each tag must be a list")
-        tags.append(Tag.parse(tag))
-
-    builder = EventBuilder(Kind(int(kind_value)), content).tags(tags)
-    return _set_builder_created_at(builder, created_at)
+    return _builder_from_payload(
+        {"kind": kind_value, "created_at": created_at, "tags": tags_value, "content": content}
+    )
 
 
 def _common_args(parser: argparse.ArgumentParser) -> None:
@@ -5170,6 +5548,12 @@ def _common_args(parser: argparse.ArgumentParser) -> None:
 
 
 def main() -> None:
+    # The bare and "interactive" invocations take no options, so they skip
+    # building the subcommand parsers.
+    if sys.argv[1:] in ([], ["interactive"]):
+        _interactive()
+        return
+
     parser = argparse.ArgumentParser(description="NCC publisher")
     subparsers = parser.add_subparsers(dest="command")
 
@@ -5243,19 +5627,19 @@ def main() -> None:
     if args.command == "edit-config":
         if not _load_config_db(args.config):
             _write_config_db(args.config, _default_config())
-            config = _load_config_or_default(args.config, _default_config())
-        relays = _prompt_list("Relays", config.get("relays") if isinstance(config, dict) else None)
+        config = _load_config_or_default(args.config, _default_config())
+        relays = _prompt_list("Relays", config.get("relays"))
         privkey = _prompt_value(
             "Privkey (nsec or hex, used for signing)",
-            config.get("privkey") if isinstance(config, dict) else None,
+            config.get("privkey"),
             required=False,
         )
         if privkey:
             try:
-                Keys.parse(privkey)
+                _parse_keys(privkey)
             except Exception:
                 raise SystemExit("privkey must be nsec or hex.")
-        tags = config.get("tags", {}) if isinstance(config, dict) else {}
+        tags = config.get("tags", {})
         summary = _prompt_value("Summary (optional)", tags.get("summary"), required=False)
         topics = _prompt_value(
             "Topics (comma-separated, optional)",
@@ -5304,7 +5688,7 @@ def main() -> None:
 
     if args.command == "create-ncc":
         config = _load_config_db(args.config)
-        config_tags = config.get("tags", {}) if isinstance(config, dict) else {}
+        config_tags = config.get("tags", {})
         d_value = input("NCC number (e.g. 01): ").strip()
         d_value = _format_ncc_identifier(d_value)
         if not d_value:
@@ -5317,34 +5701,45 @@ def main() -> None:
             raise SystemExit("Title is required")
         default_content_path = _default_ncc_content_path(d_value)
         content_path = input(f"Content path [{default_content_path}]: ").strip() or default_content_path
+        content = None
         if not os.path.exists(content_path):
-            _write_text_file(content_path, _ncc_template_content())
+            content = _ncc_template_content(title_value)
+            _write_text_file(content_path, content)
         open_now = input("Open editor now? [Y/n]: ").strip() or "y"
         if _is_truthy_response(open_now):
-            _open_in_editor(content_path)
-        content = _load_content_from_path(content_path)
-        summary = input(f"Summary (optional) [{config_tags.get('summary') or ''}]: ").strip()
-        topics_default = _format_list_default(config_tags.get("topics")) or ""
+            if _open_in_editor(content_path):
+                content = None
+        if content is None:
+            content = _load_content_from_path(content_path)
+        cfg_summary = config_tags.get("summary")
+        cfg_topics = config_tags.get("topics")
+        cfg_lang = config_tags.get("lang")
+        cfg_version = config_tags.get("version")
+        cfg_supersedes = config_tags.get("supersedes")
+        cfg_license = config_tags.get("license")
+        cfg_authors = config_tags.get("authors")
+        summary = input(f"Summary (optional) [{cfg_summary or ''}]: ").strip()
+        topics_default = _format_list_default(cfg_topics) or ""
         topics = input(f"Topics (comma-separated, optional) [{topics_default}]: ").strip()
-        lang = input(f"Lang (optional) [{config_tags.get('lang') or ''}]: ").strip()
-        version = input(f"Version (optional) [{config_tags.get('version') or ''}]: ").strip()
-        supersedes = input(f"Supersedes (event id, optional) [{config_tags.get('supersedes') or ''}]: ").strip()
-        license_id = input(f"License (optional) [{config_tags.get('license') or ''}]: ").strip()
-        authors_default = _format_list_default(config_tags.get("authors")) or ""
+        lang = input(f"Lang (optional) [{cfg_lang or ''}]: ").strip()
+        version = input(f"Version (optional) [{cfg_version or ''}]: ").strip()
+        supersedes = input(f"Supersedes (event id, optional) [{cfg_supersedes or ''}]: ").strip()
+        license_id = input(f"License (optional) [{cfg_license or ''}]: ").strip()
+        authors_default = _format_list_default(cfg_authors) or ""
         authors = input(f"Authors (npub or hex pubkey; comma-separated, optional) [{authors_default}]: ").strip()
-        authors_list = _parse_list_value(authors) or config_tags.get("authors") or []
+        authors_list = _pick_list(authors, cfg_authors)
         try:
             authors_list = _validate_author_keys(authors_list)
         except ValueError as exc:
             raise SystemExit(str(exc))
-        content = content.replace("# Title", f"# {title_value}", 1)
+        content = _apply_title_heading(content, title_value)
         tags = _ncc_tags_from_inputs(
-            summary=_normalize_optional_str(summary) or config_tags.get("summary"),
-            topics=_parse_list_value(topics) or config_tags.get("topics") or [],
-            lang=_normalize_optional_str(lang) or config_tags.get("lang"),
-            version=_normalize_optional_str(version) or config_tags.get("version"),
-            supersedes=_parse_list_value(supersedes) or config_tags.get("supersedes") or [],
-            license_id=_normalize_optional_str(license_id) or config_tags.get("license"),
+            summary=_pick_optional(summary, cfg_summary),
+            topics=_pick_list(topics, cfg_topics),
+            lang=_pick_optional(lang, cfg_lang),
+            version=_pick_optional(version, cfg_version),
+            supersedes=_pick_list(supersedes, cfg_supersedes),
+            license_id=_pick_optional(license_id, cfg_license),
             authors=authors_list,
         )
         store = DraftStore(args.config)
@@ -5355,7 +5750,7 @@ def main() -> None:
             content=content,
             tags=tags,
         )
-        export_path = args.out or input("Export JSON path (optional): ").strip() or None
+        export_path = args.out or _prompt_export_path()
         if export_path:
             payload = _payload_from_draft(30050, d_value, title_value, content, tags, _now())
             _write_json(export_path, payload)
@@ -5365,7 +5760,7 @@ def main() -> None:
 
     if args.command == "create-nsr":
         config = _load_config_db(args.config)
-        config_tags = config.get("tags", {}) if isinstance(config, dict) else {}
+        config_tags = config.get("tags", {})
         d_value = input("NCC number (e.g. 01): ").strip()
         d_value = _format_ncc_identifier(d_value)
         if not d_value:
@@ -5394,7 +5789,7 @@ def main() -> None:
             content=content_value,
             tags=tags,
         )
-        export_path = args.out or input("Export JSON path (optional): ").strip() or None
+        export_path = args.out or _prompt_export_path()
         if export_path:
             payload = _payload_from_draft(30051, d_value, None, content_value, tags, _now())
             _write_json(export_path, payload)
@@ -5434,7 +5829,7 @@ def main() -> None:
             content=content_value,
             tags=tags,
         )
-        export_path = args.out or input("Export JSON path (optional): ").strip() or None
+        export_path = args.out or _prompt_export_path()
         if export_path:
             payload = _payload_from_draft(30052, d_value, None, content_value, tags, _now())
             _write_json(export_path, payload)
@@ -5443,13 +5838,15 @@ def main() -> None:
         return
 
     config = _load_config_db(args.config)
-    config_tags = config.get("tags", {}) if isinstance(config, dict) else {}
-    relays = _merge_optional_list(args.relay, config.get("relays") if isinstance(config, dict) else None) or []
-    privkey = _merge_optional(args.privkey, config.get("privkey") if isinstance(config, dict) else None)
+    config_tags = config.get("tags", {})
+    relays = _merge_optional_list(args.relay, config.get("relays")) or []
+    if not relays:
+        raise SystemExit("At least one --relay is required to publish.")
+    privkey = _merge_optional(args.privkey, config.get("privkey"))
     if not privkey:
         raise SystemExit("--privkey is required (or set privkey in config)")
 
-    keys = Keys.parse(privkey)
+    keys = _parse_keys(privkey)
 
     if args.command == "document":
         authors_list = _merge_optional_list(args.authors, config_tags.get("authors"))
@@ -5511,7 +5908,7 @@ def main() -> None:
 
     service = PublishService(args.config)
     try:
-        with _PUBLISH_LOCK:
+        with _publish_lock(relays):
             event_id = service.publish_payload(payload, relays=relays, keys=keys)
     except Exception as exc:
         service.enqueue_task(